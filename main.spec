@@ -31,7 +31,7 @@ a = Analysis(
         'src.game.board',
         'src.game.adjacent_counter',
         'src.game.chording',
-        'src.game.flood_fill',
+        'src.game.flood_fill_nb',
         'src.game.mine_placement',
         'src.models.cell',
         'src.models.game_state',
@@ -7,8 +7,60 @@ on the game board. This information is displayed to the player as numbers 1-8.
 
 from typing import List
 
+import numpy as np
+
 from src.models.cell import Cell
 
+NEIGHBOR_OFFSETS = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+"""(row, col) offsets of the 8 neighbors of a cell, excluding the cell itself."""
+
+
+def calculate_adjacent_mines_np(mine: np.ndarray) -> np.ndarray:
+    """
+    Calculate the adjacent mine count for every cell from a boolean mine array.
+
+    The mine array is zero-padded by one cell on every side, and the nine
+    shifted 3x3-window slices of the padded array are summed. Subtracting the
+    original array removes each cell's own mine from its count. This replaces
+    a Python-level scan of every cell's 8 neighbors with nine whole-array
+    additions.
+
+    Cells outside the board contribute nothing (they are padding zeros), so
+    edge and corner cells naturally max out at 5 and 3 respectively.
+
+    Args:
+        mine: 2D boolean array, True where a cell contains a mine.
+
+    Returns:
+        2D uint8 array of the same shape holding each cell's count (0-8).
+
+    Example:
+        >>> mine = np.zeros((3, 3), dtype=np.bool_)
+        >>> mine[0, 0] = True
+        >>> int(calculate_adjacent_mines_np(mine)[1, 1])
+        1
+    """
+    rows, cols = mine.shape
+    padded = np.pad(mine.astype(np.uint8), 1)
+
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            counts += padded[dr : dr + rows, dc : dc + cols]
+
+    # The 3x3 window includes the cell itself; remove its own mine
+    counts -= mine
+    return counts
+
 
 def calculate_adjacent_mines(grid: List[List[Cell]], rows: int, cols: int) -> None:
     """
@@ -22,8 +74,9 @@ def calculate_adjacent_mines(grid: List[List[Cell]], rows: int, cols: int) -> No
     Edge and corner cells have fewer than 8 neighbors, so their maximum
     possible count is lower (e.g., corner cells max is 3, edge cells max is 5).
 
-    This function modifies the grid in-place by updating each cell's
-    adjacent_mines attribute.
+    The counting itself is done by calculate_adjacent_mines_np; this function
+    gathers the grid's mine flags into an array and writes the results back,
+    modifying the grid in-place.
 
     Args:
         grid: 2D list of Cell objects representing the game board.
@@ -36,57 +89,15 @@ def calculate_adjacent_mines(grid: List[List[Cell]], rows: int, cols: int) -> No
         >>> calculate_adjacent_mines(board.grid, board.rows, board.cols)
         >>> # Now each cell has its adjacent mine count calculated
     """
-    # Iterate through every cell in the grid
-    for row in range(rows):
-        for col in range(cols):
-            # Count mines in the 8 neighbors of this cell
-            adjacent_count = _count_neighbor_mines(grid, row, col, rows, cols)
-
-            # Store the count in the cell
-            grid[row][col].adjacent_mines = adjacent_count
-
-
-def _count_neighbor_mines(
-    grid: List[List[Cell]], row: int, col: int, rows: int, cols: int
-) -> int:
-    """
-    Count the number of mines in the 8 neighboring cells.
-
-    Checks all 8 cells surrounding the given cell (horizontal, vertical,
-    and diagonal neighbors). Only counts mines in cells that are within
-    the board boundaries.
-
-    Args:
-        grid: 2D list of Cell objects representing the game board.
-        row: Row index of the cell to check neighbors for (0-based).
-        col: Column index of the cell to check neighbors for (0-based).
-        rows: Number of rows in the grid.
-        cols: Number of columns in the grid.
-
-    Returns:
-        Integer count of mines in the 8 neighboring cells (range: 0-8).
-
-    Example:
-        >>> # For a cell at (4, 4) with mines at (4, 3) and (5, 5)
-        >>> _count_neighbor_mines(grid, 4, 4, 9, 9)
-        2
-    """
-    mine_count = 0
-
-    # Check all 8 directions around the cell
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            # Skip the cell itself (dr=0, dc=0)
-            if dr == 0 and dc == 0:
-                continue
-
-            # Calculate neighbor coordinates
-            neighbor_row = row + dr
-            neighbor_col = col + dc
-
-            # Only count if neighbor is within bounds
-            if 0 <= neighbor_row < rows and 0 <= neighbor_col < cols:
-                if grid[neighbor_row][neighbor_col].mine:
-                    mine_count += 1
-
-    return mine_count
+    mine = np.array(
+        [[grid[row][col].mine for col in range(cols)] for row in range(rows)],
+        dtype=np.bool_,
+    )
+
+    counts = calculate_adjacent_mines_np(mine)
+
+    # Store the counts back in the cells. tolist() converts the whole array
+    # to Python ints in one C pass instead of boxing one NumPy scalar per cell
+    for grid_row, count_row in zip(grid, counts.tolist()):
+        for cell, count in zip(grid_row, count_row):
+            cell.adjacent_mines = count
@@ -1,29 +1,45 @@
 """
 Board Game Module
 
-Manages the game board for Minedetector, including the 2D grid of cells,
+Manages the game board for Minedetector, including the cell storage,
 mine placement, and board-level operations.
 """
 
-from typing import List
+from functools import cached_property
+from typing import List, Optional, Set, Tuple
 
-from src.game import adjacent_counter, chording, flood_fill, mine_placement
-from src.models.cell import Cell
+import numpy as np
+
+from src.game import adjacent_counter, chording, flood_fill_nb, mine_placement
+from src.models.cell import CellView
 from src.models.game_state import GameState
 
 
 class Board:
     """
-    Represents the Minedetector game board as a 2D grid of Cell objects.
+    Represents the Minedetector game board.
 
-    The board manages all cells, handles coordinate validation, and provides
-    access to individual cells for game logic operations.
+    Cell state is stored as a structure of arrays: one contiguous 2D NumPy
+    array per cell attribute, indexed by [row, col]. The board also keeps a
+    running count of revealed cells and a mine-hit flag, so the win and loss
+    checks run in constant time instead of scanning the board after every
+    click. Object-style access is still available through ``grid`` and
+    ``get_cell``, which hand out CellView proxies backed by these arrays.
 
     Attributes:
         rows: Integer number of rows in the grid (e.g., 9 for Beginner).
         cols: Integer number of columns in the grid (e.g., 9 for Beginner).
         mine_count: Total number of mines to be placed on the board.
-        grid: 2D list (list of lists) of Cell objects. Access via grid[row][col].
+        mine: Boolean array, True where a cell contains a mine.
+        revealed: Boolean array, True where a cell has been revealed.
+        flagged: Boolean array, True where a cell has been flagged.
+        adjacent_mines: uint8 array of mine counts in each cell's 8 neighbors.
+        zero_adj: Boolean array, True where a safe cell has 0 adjacent mines.
+        grid: 2D list of CellView proxies. Access via grid[row][col].
+        revealed_count: Number of cells revealed so far.
+
+    Every cell whose state changes is also recorded as dirty, so a view can
+    redraw just those cells (see take_dirty_cells) instead of the whole board.
 
     Example:
         >>> board = Board(9, 9, 10)  # Beginner difficulty
@@ -36,7 +52,7 @@ class Board:
         """
         Initialize a new Minedetector board with the specified dimensions.
 
-        Creates a 2D grid of Cell objects with all cells in their initial state:
+        Allocates the cell arrays with all cells in their initial state:
         - mine: False (no mines placed yet)
         - revealed: False (all cells hidden)
         - flagged: False (no flags placed)
@@ -66,17 +82,168 @@ class Board:
         self.mine_count = mine_count
         """Total number of mines to be placed on the board."""
 
-        # Initialize 2D grid with Cell objects
-        # Using list comprehension for clean, efficient creation
-        self.grid: List[List[Cell]] = [
-            [Cell() for _ in range(cols)] for _ in range(rows)
-        ]
-        """2D list of Cell objects. Access via grid[row][col]."""
+        # Structure-of-arrays cell storage, one contiguous array per attribute
+        self.mine = np.zeros((rows, cols), dtype=np.bool_)
+        """Boolean array, True where a cell contains a mine."""
+
+        self.revealed = np.zeros((rows, cols), dtype=np.bool_)
+        """Boolean array, True where a cell has been revealed."""
+
+        self.flagged = np.zeros((rows, cols), dtype=np.bool_)
+        """Boolean array, True where a cell has been flagged."""
+
+        self.adjacent_mines = np.zeros((rows, cols), dtype=np.uint8)
+        """Count of mines in each cell's 8 neighbors (range: 0-8)."""
+
+        self.zero_adj = np.ones((rows, cols), dtype=np.bool_)
+        """Boolean array, True where a safe cell has 0 adjacent mines (these
+        are the cells the flood fill spreads from)."""
+
+        # Flood fill kernel for this board's shape, specialized for the
+        # standard difficulty sizes
+        self._fill_kernel = flood_fill_nb.kernel_for_shape(rows, cols)
+        """Multi-seed flood fill kernel used by reveal_cell and chord_cell."""
+
+        self._fill_queue = np.empty(rows * cols, dtype=np.int32)
+        """Work queue reused by every fill; afterwards its head lists the cells
+        the fill revealed."""
+
+        self._dirty: Set[int] = set()
+        """Flat indices (row * cols + col) of cells changed since the last
+        take_dirty_cells() call."""
+
+        # Incremental win/loss bookkeeping, kept in step with every reveal
+        self._safe_cells = rows * cols - mine_count
+        """Number of non-mine cells that must be revealed to win."""
+
+        self._revealed_count = 0
+        """Number of cells revealed so far."""
+
+        self._flag_count = 0
+        """Number of cells currently flagged."""
+
+        self._mine_hit = False
+        """Set once a mine cell has been revealed."""
 
         # Initialize game state
         self.game_state: GameState = GameState.PLAYING
         """Current state of the game (PLAYING, WON, or LOST)."""
 
+    @cached_property
+    def grid(self) -> List[List[CellView]]:
+        """
+        2D list of CellView proxies. Access via grid[row][col].
+
+        Built on first access, so code that only works with the arrays never
+        pays for the per-cell proxy objects.
+        """
+        return [
+            [CellView(self, row, col) for col in range(self.cols)]
+            for row in range(self.rows)
+        ]
+
+    @property
+    def revealed_count(self) -> int:
+        """Number of cells revealed so far."""
+        return self._revealed_count
+
+    @property
+    def flag_count(self) -> int:
+        """Number of cells currently flagged."""
+        return self._flag_count
+
+    def _set_revealed(self, row: int, col: int, value: bool) -> None:
+        """
+        Set the revealed flag of one cell, keeping the reveal counters in step.
+
+        Used by CellView so writes through ``grid`` are counted the same way as
+        reveals done by the flood fill kernel.
+
+        Args:
+            row: Row index of the cell (0-based).
+            col: Column index of the cell (0-based).
+            value: New revealed state.
+        """
+        value = bool(value)
+        if self.revealed[row, col] == value:
+            return
+        self.revealed[row, col] = value
+        if value:
+            self._revealed_count += 1
+            if self.mine[row, col]:
+                self._mine_hit = True
+        else:
+            self._revealed_count -= 1
+        self._dirty.add(row * self.cols + col)
+
+    def _set_flagged(self, row: int, col: int, value: bool) -> None:
+        """
+        Set the flagged flag of one cell, keeping flag_count in step.
+
+        Args:
+            row: Row index of the cell (0-based).
+            col: Column index of the cell (0-based).
+            value: New flagged state.
+        """
+        value = bool(value)
+        if self.flagged[row, col] == value:
+            return
+        self.flagged[row, col] = value
+        self._flag_count += 1 if value else -1
+        self._dirty.add(row * self.cols + col)
+
+    def _set_mine(self, row: int, col: int, value: bool) -> None:
+        """
+        Set the mine flag of one cell, noting a hit if the cell is already revealed.
+
+        Args:
+            row: Row index of the cell (0-based).
+            col: Column index of the cell (0-based).
+            value: New mine state.
+        """
+        self.mine[row, col] = value
+        self.zero_adj[row, col] = not value and self.adjacent_mines[row, col] == 0
+        if value and self.revealed[row, col]:
+            self._mine_hit = True
+        self._dirty.add(row * self.cols + col)
+
+    def _set_adjacent_mines(self, row: int, col: int, value: int) -> None:
+        """
+        Set the adjacent mine count of one cell, keeping zero_adj in step.
+
+        Args:
+            row: Row index of the cell (0-based).
+            col: Column index of the cell (0-based).
+            value: New adjacent mine count (0-8).
+        """
+        self.adjacent_mines[row, col] = value
+        self.zero_adj[row, col] = value == 0 and not self.mine[row, col]
+        self._dirty.add(row * self.cols + col)
+
+    def take_dirty_cells(self) -> List[Tuple[int, int]]:
+        """
+        Return the cells changed since the last call, and forget them.
+
+        Reveals (including whole flood-filled regions), flags and any other
+        cell writes made through the board or ``grid`` are collected, so a
+        view only needs to redraw these cells after an operation.
+
+        Returns:
+            List of (row, col) coordinates, each at most once, in no
+            particular order.
+
+        Example:
+            >>> board = Board(9, 9, 0)
+            >>> board.reveal_cell(4, 4)
+            >>> len(board.take_dirty_cells())
+            81
+            >>> board.take_dirty_cells()
+            []
+        """
+        dirty, self._dirty = self._dirty, set()
+        cols = self.cols
+        return [divmod(index, cols) for index in dirty]
+
     def is_valid_coordinate(self, row: int, col: int) -> bool:
         """
         Check if the given coordinates are within the board boundaries.
@@ -90,7 +257,7 @@ class Board:
         """
         return 0 <= row < self.rows and 0 <= col < self.cols
 
-    def get_cell(self, row: int, col: int) -> Cell:
+    def get_cell(self, row: int, col: int) -> CellView:
         """
         Get the cell at the specified coordinates.
 
@@ -99,7 +266,7 @@ class Board:
             col: Column index (0-based).
 
         Returns:
-            The Cell object at the specified coordinates.
+            A CellView of the cell at the specified coordinates.
 
         Raises:
             IndexError: If coordinates are out of bounds.
@@ -111,7 +278,12 @@ class Board:
             )
         return self.grid[row][col]
 
-    def place_mines(self, first_click_row: int, first_click_col: int) -> None:
+    def place_mines(
+        self,
+        first_click_row: int,
+        first_click_col: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
         """
         Place mines on the board, ensuring first-click safety.
 
@@ -126,6 +298,8 @@ class Board:
         Args:
             first_click_row: Row index of the first-click cell (0-based).
             first_click_col: Column index of the first-click cell (0-based).
+            rng: Optional random generator to draw the mines from, e.g. a
+                 seeded one for a reproducible layout.
 
         Raises:
             ValueError: If the first-click coordinates are out of bounds.
@@ -145,18 +319,80 @@ class Board:
                 f"out of bounds for board size ({self.rows}x{self.cols})"
             )
 
-        # Delegate to mine_placement module
-        mine_placement.place_mines(
-            self.grid,
+        # Without mines there is nothing to place or count: adjacent_mines
+        # and zero_adj already describe an empty board
+        if self.mine_count == 0:
+            return
+
+        # Choose the mine cells, then place them all with one array write
+        chosen = mine_placement.choose_mine_indices(
             self.rows,
             self.cols,
             self.mine_count,
             first_click_row,
             first_click_col,
+            rng,
         )
+        self.mine.flat[chosen] = True
+        self._update_mine_counts()
+
+    def set_mines_from_mask(self, mask: np.ndarray) -> None:
+        """
+        Lay out the mines from a boolean mask, replacing any existing mines.
+
+        The whole layout is written with one array copy, and the adjacent
+        mine counts are recalculated in one array pass, instead of setting
+        the mine flag cell by cell. Useful for fixed layouts such as tests
+        or puzzles; there is no first-click safety. Every cell whose mine
+        flag or adjacent count changed is marked dirty.
+
+        Args:
+            mask: 2D boolean array of shape (rows, cols), True where a cell
+                  contains a mine. It must hold exactly mine_count mines.
+
+        Raises:
+            ValueError: If the mask shape does not match the board or it does
+                        not hold exactly mine_count mines.
+
+        Example:
+            >>> board = Board(3, 3, 1)
+            >>> mask = np.zeros((3, 3), dtype=np.bool_)
+            >>> mask[0, 0] = True
+            >>> board.set_mines_from_mask(mask)
+            >>> board.grid[1][1].adjacent_mines
+            1
+        """
+        mask = np.asarray(mask, dtype=np.bool_)
+        if mask.shape != self.mine.shape:
+            raise ValueError(
+                f"Mine mask shape {mask.shape} does not match "
+                f"board size ({self.rows}x{self.cols})"
+            )
+        mines = int(np.count_nonzero(mask))
+        if mines != self.mine_count:
+            raise ValueError(
+                f"Mine mask holds {mines} mines, expected {self.mine_count}"
+            )
+
+        old_mine = self.mine.copy()
+        old_adjacent = self.adjacent_mines.copy()
+
+        self.mine[:] = mask
+        if (mask & self.revealed).any():
+            self._mine_hit = True
+        self._update_mine_counts()
+
+        changed = (self.mine != old_mine) | (self.adjacent_mines != old_adjacent)
+        self._dirty.update(np.flatnonzero(changed).tolist())
+
+    def _update_mine_counts(self) -> None:
+        """Recalculate adjacent_mines and zero_adj from the mine array."""
+        # Calculate adjacent mine counts for all cells in one array pass
+        self.adjacent_mines[:] = adjacent_counter.calculate_adjacent_mines_np(self.mine)
 
-        # Calculate adjacent mine counts for all cells
-        adjacent_counter.calculate_adjacent_mines(self.grid, self.rows, self.cols)
+        # Precompute where the flood fill may spread: safe cells with count 0
+        np.equal(self.adjacent_mines, 0, out=self.zero_adj)
+        self.zero_adj &= ~self.mine
 
     def reveal_cell(self, row: int, col: int) -> None:
         """
@@ -167,8 +403,10 @@ class Board:
         mines, the flood fill continues recursively through those cells.
 
         The flood fill stops at cells with adjacent mines > 0, revealing them but
-        not continuing past them. This uses an iterative stack-based approach to
-        avoid stack overflow on large boards (e.g., Expert with 480 cells).
+        not continuing past them. The fill runs in the array-based kernel from
+        flood_fill_nb (JIT-compiled when Numba is available), which uses an
+        explicit breadth-first queue to avoid recursion depth issues on large
+        boards.
 
         Args:
             row: Row index of the cell to reveal (0-based).
@@ -184,8 +422,24 @@ class Board:
             >>> # If cell (4,4) has 0 adjacent mines, flood fill
             >>> # reveals connected region
         """
-        # Delegate to flood_fill module
-        flood_fill.reveal_cell(self.grid, row, col, self.rows, self.cols)
+        if not self.is_valid_coordinate(row, col):
+            raise IndexError(
+                f"Coordinates ({row}, {col}) out of bounds "
+                f"for board size ({self.rows}x{self.cols})"
+            )
+
+        # Delegate to the array-based flood fill kernel
+        seeds = np.array([row * self.cols + col], dtype=np.int64)
+        newly_revealed = self._fill_kernel(
+            self.revealed, self.flagged, self.zero_adj, seeds, self._fill_queue
+        )
+        self._revealed_count += newly_revealed
+        self._dirty.update(self._fill_queue[:newly_revealed].tolist())
+
+        # Only the clicked cell can be a mine; the fill never expands past a
+        # numbered cell, so it never reaches one
+        if newly_revealed and self.mine[row, col]:
+            self._mine_hit = True
 
     def chord_cell(self, row: int, col: int) -> None:
         """
@@ -213,16 +467,55 @@ class Board:
             >>> board.grid[3][4].flagged = True
             >>> board.chord_cell(4, 4)  # Reveal remaining neighbors
         """
-        # Delegate to chording module
-        chording.chord_cell(self.grid, row, col, self.rows, self.cols)
+        # The chording module decides which neighbors to reveal, as flat
+        # indices read straight from the arrays; the kernel then reveals all
+        # of them in one batched flood fill
+        seeds = chording.chord_seeds(
+            self.revealed, self.flagged, self.adjacent_mines, row, col
+        )
+        if not seeds.size:
+            return
+
+        newly_revealed = self._fill_kernel(
+            self.revealed, self.flagged, self.zero_adj, seeds, self._fill_queue
+        )
+        self._revealed_count += newly_revealed
+        self._dirty.update(self._fill_queue[:newly_revealed].tolist())
+
+        # Targets are never flagged, so every one of them is now revealed
+        if self.mine.flat[seeds].any():
+            self._mine_hit = True
+
+    def reveal_mines(self) -> None:
+        """
+        Reveal every mine cell, as shown to the player after a loss.
+
+        The hidden mines are found and revealed with array operations, and
+        the reveal counters and dirty cells are updated in one step, rather
+        than revealing the cells one at a time.
+
+        Example:
+            >>> board.reveal_mines()
+            >>> bool((board.revealed | ~board.mine).all())
+            True
+        """
+        hidden_mines = self.mine & ~self.revealed
+        indices = np.flatnonzero(hidden_mines)
+        if not indices.size:
+            return
+
+        self.revealed |= hidden_mines
+        self._revealed_count += indices.size
+        self._mine_hit = True
+        self._dirty.update(indices.tolist())
 
     def is_won(self) -> bool:
         """
         Check if the game has been won.
 
-        A game is won when all non-mine cells have been revealed. This method
-        counts the number of revealed cells and compares it to the total number
-        of non-mine cells (total cells - mine_count).
+        A game is won when all non-mine cells have been revealed. The board
+        keeps a running count of revealed cells, so this is a single comparison
+        against the number of non-mine cells (total cells - mine_count).
 
         Returns:
             True if all non-mine cells are revealed (game is won), False otherwise.
@@ -234,22 +527,16 @@ class Board:
             >>> board.is_won()
             True
         """
-        # Count total cells that should be revealed to win
-        total_cells = self.rows * self.cols
-        safe_cells = total_cells - self.mine_count
-
-        # Count currently revealed cells
-        revealed_count = sum(1 for row in self.grid for cell in row if cell.revealed)
-
         # Win condition: all safe cells are revealed
-        return revealed_count == safe_cells
+        return self._revealed_count == self._safe_cells
 
     def is_lost(self) -> bool:
         """
         Check if the game has been lost.
 
-        A game is lost when any mine cell has been revealed. This method checks
-        all mine cells to see if any of them have been revealed by the player.
+        A game is lost when any mine cell has been revealed. The board records
+        a mine hit at the moment it happens, so this is a flag lookup rather
+        than a scan over the mine cells.
 
         Returns:
             True if any mine has been revealed (game is lost), False otherwise.
@@ -262,7 +549,7 @@ class Board:
             True
         """
         # Check if any mine cell has been revealed
-        return any(cell.mine and cell.revealed for row in self.grid for cell in row)
+        return self._mine_hit
 
     def update_game_state(self) -> None:
         """
@@ -273,7 +560,8 @@ class Board:
         LOST), this method does nothing to prevent changing the state back to
         PLAYING.
 
-        The checks are performed in this order:
+        The checks are performed in this order, each in constant time using
+        the board's running reveal counters:
         1. Loss: If any mine is revealed, set state to LOST
         2. Win: If all non-mine cells are revealed, set state to WON
         3. Otherwise: Keep state as PLAYING
@@ -298,12 +586,12 @@ class Board:
             return
 
         # Check for loss first (mine revealed)
-        if self.is_lost():
+        if self._mine_hit:
             self.game_state = GameState.LOST
             return
 
         # Check for win (all safe cells revealed)
-        if self.is_won():
+        if self._revealed_count == self._safe_cells:
             self.game_state = GameState.WON
             return
 
@@ -0,0 +1,191 @@
+"""
+Compiled Flood Fill Module
+
+Array-based flood fill kernels used by Board.reveal_cell and
+Board.chord_cell. The kernels work directly on the board's NumPy arrays and
+are compiled with Numba when it is installed; without Numba the same
+functions run as plain Python.
+"""
+
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from src.game.adjacent_counter import NEIGHBOR_OFFSETS
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the installed environment
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def flood_fill_into_nb(
+    revealed: np.ndarray,
+    flagged: np.ndarray,
+    zero_adj: np.ndarray,
+    seeds: np.ndarray,
+    queue: np.ndarray,
+) -> int:
+    """
+    Reveal several cells at once and flood fill outward from all of them.
+
+    Every seed that is not already revealed or flagged is revealed and put on
+    one shared queue, so overlapping regions (e.g. two blank neighbors of a
+    chorded cell) are walked once. The caller supplies the work queue (an
+    int32 array of at least rows * cols slots, reusable across calls). On
+    return, ``queue[:count]`` holds the flat indices of exactly the cells
+    this call revealed, so callers can tell which cells changed without
+    scanning the board.
+
+    Coordinates are not validated here; callers must pass in-bounds values.
+
+    Args:
+        revealed: 2D boolean array of revealed cells (modified in-place).
+        flagged: 2D boolean array of flagged cells.
+        zero_adj: 2D boolean array, True for safe cells with 0 adjacent mines.
+        seeds: 1D integer array of flat seed indices (row * cols + col).
+        queue: 1D int32 scratch array with at least rows * cols slots.
+
+    Returns:
+        Number of cells newly revealed.
+    """
+    rows, cols = revealed.shape
+    return _fill(revealed, flagged, zero_adj, seeds, rows, cols, queue)
+
+
+@njit(cache=True)
+def _fill(
+    revealed: np.ndarray,
+    flagged: np.ndarray,
+    zero_adj: np.ndarray,
+    seeds: np.ndarray,
+    rows: int,
+    cols: int,
+    queue: np.ndarray,
+) -> int:
+    """
+    Shared body of the flood fill kernels, with the board shape passed in.
+
+    Pending cells are kept in an int32 FIFO queue of flat indices
+    (row * cols + col), read from ``head`` and appended at ``tail``, instead
+    of a list of tuples, so the loop does no allocation. Breadth-first order
+    keeps consecutive reads close together on the board. Whether a cell
+    spreads the fill is a single byte read from the precomputed zero_adj mask.
+    """
+    # Cells are revealed as they are enqueued, so the revealed array doubles
+    # as the "already queued" mark: each cell is enqueued at most once and
+    # the queue never needs more than rows * cols slots (no wrap-around)
+    head = 0
+    tail = 0
+
+    for seed in seeds:
+        r = seed // cols
+        c = seed - r * cols
+
+        # Seeds that are already revealed or flagged are skipped
+        if not revealed[r, c] and not flagged[r, c]:
+            revealed[r, c] = True
+            queue[tail] = seed
+            tail += 1
+
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        r = idx // cols
+        c = idx - r * cols
+
+        # Numbered cells are revealed but do not spread the fill
+        if not zero_adj[r, c]:
+            continue
+
+        for dr, dc in NEIGHBOR_OFFSETS:
+            nr = r + dr
+            nc = c + dc
+            if nr < 0 or nr >= rows or nc < 0 or nc >= cols:
+                continue
+            if not revealed[nr, nc] and not flagged[nr, nc]:
+                revealed[nr, nc] = True
+                queue[tail] = nr * cols + nc
+                tail += 1
+
+    # Every enqueued cell was newly revealed
+    return tail
+
+
+SPECIALIZED_SHAPES = ((9, 9), (16, 16), (16, 30))
+"""Board shapes (rows, cols) of the standard difficulties, which get kernels
+compiled with their dimensions as constants."""
+
+_specialized_kernels: Dict[Tuple[int, int], Callable[..., int]] = {}
+
+
+def _specialize(rows: int, cols: int) -> Callable[..., int]:
+    """
+    Build a flood_fill_into_nb variant with the board shape baked in.
+
+    Numba freezes closure variables into the compiled code, so ``rows`` and
+    ``cols`` reach _fill as compile-time constants: the bounds checks and the
+    flat-index division compile against literals instead of runtime values.
+    """
+
+    @njit(cache=True)
+    def kernel(
+        revealed: np.ndarray,
+        flagged: np.ndarray,
+        zero_adj: np.ndarray,
+        seeds: np.ndarray,
+        queue: np.ndarray,
+    ) -> int:
+        return _fill(revealed, flagged, zero_adj, seeds, rows, cols, queue)
+
+    return kernel
+
+
+def kernel_for_shape(rows: int, cols: int) -> Callable[..., int]:
+    """
+    Return the fastest multi-seed flood fill kernel for a board shape.
+
+    Standard difficulty shapes (see SPECIALIZED_SHAPES) get a kernel
+    specialized to their dimensions, built once and shared by every board of
+    that shape. Any other shape uses the generic flood_fill_into_nb.
+
+    Args:
+        rows: Number of rows in the board.
+        cols: Number of columns in the board.
+
+    Returns:
+        A kernel with the signature of flood_fill_into_nb.
+    """
+    if (rows, cols) not in SPECIALIZED_SHAPES:
+        return flood_fill_into_nb
+
+    kernel = _specialized_kernels.get((rows, cols))
+    if kernel is None:
+        kernel = _specialized_kernels[(rows, cols)] = _specialize(rows, cols)
+    return kernel
+
+
+def warm_up(rows: int, cols: int) -> None:
+    """
+    Run the kernel for a board shape once so JIT compilation happens early.
+
+    Otherwise the player's first click on a board of that shape pays the
+    compilation cost. Only the kernel_for_shape kernel for this shape
+    is run, on an empty board, so the other shapes still compile lazily.
+
+    Args:
+        rows: Number of rows in the board.
+        cols: Number of columns in the board.
+    """
+    revealed = np.zeros((rows, cols), dtype=np.bool_)
+    flagged = np.zeros((rows, cols), dtype=np.bool_)
+    zero_adj = np.zeros((rows, cols), dtype=np.bool_)
+    seeds = np.zeros(1, dtype=np.int64)
+    queue = np.empty(rows * cols, dtype=np.int32)
+    kernel_for_shape(rows, cols)(revealed, flagged, zero_adj, seeds, queue)
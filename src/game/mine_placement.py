@@ -5,118 +5,65 @@ Handles the random placement of mines on the game board with first-click safety.
 The first-click cell and its neighbors are guaranteed to be mine-free.
 """
 
-import random
-from typing import List, Tuple
+from typing import Optional
 
-from src.models.cell import Cell
+import numpy as np
 
+_rng = np.random.default_rng()
+"""Default random generator for mine placement, created once per process."""
 
-def place_mines(
-    grid: List[List[Cell]],
+
+def choose_mine_indices(
     rows: int,
     cols: int,
     mine_count: int,
     first_click_row: int,
     first_click_col: int,
-) -> None:
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
     """
-    Place mines randomly on the board, ensuring the first-click cell is safe.
-
-    This function randomly distributes mines across the board while guaranteeing
-    that the first-click cell and all 8 of its neighbors remain mine-free. This
-    implements the first-click safety feature that prevents the player from
-    losing on their very first click.
+    Choose random flat mine indices, keeping the first-click cell and neighbors safe.
 
-    The function uses a while loop to randomly select coordinates and place mines,
-    skipping cells that already have mines or are in the protected zone around
-    the first-click cell.
+    Mines are drawn without replacement from the cells outside the protected
+    zone, as flat indices (row * cols + col). Passing a seeded generator
+    makes the layout reproducible.
 
     Args:
-        grid: 2D list of Cell objects representing the game board.
         rows: Number of rows in the grid.
         cols: Number of columns in the grid.
         mine_count: Total number of mines to place on the board.
         first_click_row: Row index of the first-click cell (0-based).
         first_click_col: Column index of the first-click cell (0-based).
+        rng: Optional random generator to draw from. Defaults to the module's
+             shared generator.
+
+    Returns:
+        1D integer array of mine_count distinct flat indices.
 
     Raises:
         ValueError: If mine_count exceeds the number of available cells (excluding
                     the protected zone around first-click).
-
-    Example:
-        >>> board = Board(9, 9, 10)
-        >>> place_mines(
-        >>>     board.grid, board.rows, board.cols, board.mine_count, 4, 4
-        >>> )
-        >>> # Now board has 10 mines placed, with cell (4,4) and
-        >>> # neighbors guaranteed safe
     """
-    # Validate that we have enough space to place mines
-    # Protected zone includes first-click cell and its 8 neighbors
-    protected_cells = _get_protected_zone(first_click_row, first_click_col, rows, cols)
-    available_cells = (rows * cols) - len(protected_cells)
+    # Mask of eligible cells: everything except the protected zone (the
+    # first-click cell and its 8 neighbors), cleared with one slice write.
+    # Slicing clips the 3x3 block at the board edges, so no set of
+    # coordinates or bounds checks are needed
+    mask = np.ones((rows, cols), dtype=np.bool_)
+    mask[
+        max(first_click_row - 1, 0) : first_click_row + 2,
+        max(first_click_col - 1, 0) : first_click_col + 2,
+    ] = False
+    eligible = np.flatnonzero(mask)
 
+    # Validate that we have enough space to place mines
+    available_cells = len(eligible)
     if mine_count > available_cells:
         raise ValueError(
             f"Cannot place {mine_count} mines with only {available_cells} "
-            f"available cells (protected zone: {len(protected_cells)} cells)"
+            f"available cells (protected zone: {rows * cols - available_cells} "
+            f"cells)"
         )
 
-    mines_placed = 0
-
-    # Continue placing mines until we reach the required count
-    while mines_placed < mine_count:
-        # Generate random coordinates
-        row = random.randint(0, rows - 1)
-        col = random.randint(0, cols - 1)
-
-        # Skip if this cell already has a mine
-        if grid[row][col].mine:
-            continue
-
-        # Skip if this cell is in the protected zone (first-click or neighbors)
-        if (row, col) in protected_cells:
-            continue
-
-        # Place mine at this location
-        grid[row][col].mine = True
-        mines_placed += 1
-
-
-def _get_protected_zone(
-    first_click_row: int, first_click_col: int, rows: int, cols: int
-) -> List[Tuple[int, int]]:
-    """
-    Get the list of cells that must be kept mine-free (first-click and neighbors).
-
-    The protected zone consists of the first-click cell and all 8 of its
-    neighboring cells. Neighbors are defined using the 8-directional movement
-    pattern (horizontal, vertical, and diagonal).
-
-    Args:
-        first_click_row: Row index of the first-click cell (0-based).
-        first_click_col: Column index of the first-click cell (0-based).
-        rows: Number of rows in the grid.
-        cols: Number of columns in the grid.
-
-    Returns:
-        List of (row, col) tuples representing all protected cells.
-        All coordinates are within board bounds.
-
-    Example:
-        >>> _get_protected_zone(4, 4, 9, 9)
-        [(3, 3), (3, 4), (3, 5), (4, 3), (4, 4), (4, 5), (5, 3), (5, 4), (5, 5)]
-    """
-    protected = []
-
-    # Check all 8 directions around the first-click cell
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            row = first_click_row + dr
-            col = first_click_col + dc
-
-            # Only add coordinates that are within bounds
-            if 0 <= row < rows and 0 <= col < cols:
-                protected.append((row, col))
-
-    return protected
+    if rng is None:
+        rng = _rng
+    return rng.choice(eligible, size=mine_count, replace=False)
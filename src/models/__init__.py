@@ -3,10 +3,11 @@ Data Models Package
 
 Contains core data structures for the Minedetector game including:
 - Cell: Represents a single cell on the game board
+- CellView: Attribute-style view of a cell stored in a Board's arrays
 - GameState: Enum representing game states (playing, won, lost)
 """
 
-from .cell import Cell
+from .cell import Cell, CellView
 from .game_state import GameState
 
-__all__ = ["Cell", "GameState"]
+__all__ = ["Cell", "CellView", "GameState"]
@@ -4,16 +4,28 @@ Cell Data Model
 Represents a single cell in the Minedetector game board.
 Each cell tracks its mine status, revealed state, flag state, and
     adjacent mine count.
+
+Also provides CellView, an attribute-style view onto a cell that lives in a
+Board's structure-of-arrays storage.
 """
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.game.board import Board
 
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """
     Represents a single cell on the Minedetector game board.
 
+    The class is slotted: attributes live at fixed offsets rather than in a
+    per-instance ``__dict__``, which makes each cell much smaller and attribute
+    access cheaper. Assigning any attribute not listed below raises
+    AttributeError.
+
     Attributes:
         mine: Boolean indicating whether this cell contains a mine.
             Defaults to False.
@@ -36,3 +48,90 @@ class Cell:
 
     adjacent_mines: int = 0
     """Count of mines in the 8 neighboring cells (range: 0-8)."""
+
+
+class CellView:
+    """
+    Live view of a single cell stored in a Board's structure-of-arrays layout.
+
+    The Board keeps each cell attribute in its own NumPy array, so there is no
+    per-cell object to hand out. CellView exposes the same attributes as Cell
+    for code that wants object-style access (the UI, tests, and the
+    grid-based game logic helpers); every read and write goes straight to the
+    board's arrays. Writes to ``mine``, ``revealed`` and ``adjacent_mines`` go
+    through the board so its derived state (reveal counters, zero_adj mask)
+    stays in step.
+
+    Attributes:
+        mine: Whether this cell contains a mine.
+        revealed: Whether this cell has been revealed by the player.
+        flagged: Whether this cell has been flagged by the player.
+        adjacent_mines: Count of mines in the 8 neighboring cells (0-8).
+    """
+
+    __slots__ = ("_board", "_row", "_col")
+
+    def __init__(self, board: "Board", row: int, col: int):
+        """
+        Create a view of the cell at (row, col) on the given board.
+
+        Args:
+            board: The Board whose arrays back this view.
+            row: Row index of the cell (0-based).
+            col: Column index of the cell (0-based).
+        """
+        self._board = board
+        self._row = row
+        self._col = col
+
+    @property
+    def mine(self) -> bool:
+        """Is this cell a mine?"""
+        return bool(self._board.mine[self._row, self._col])
+
+    @mine.setter
+    def mine(self, value: bool) -> None:
+        self._board._set_mine(self._row, self._col, value)
+
+    @property
+    def revealed(self) -> bool:
+        """Has the user revealed this cell?"""
+        return bool(self._board.revealed[self._row, self._col])
+
+    @revealed.setter
+    def revealed(self, value: bool) -> None:
+        self._board._set_revealed(self._row, self._col, value)
+
+    @property
+    def flagged(self) -> bool:
+        """Has the user placed a flag on this cell?"""
+        return bool(self._board.flagged[self._row, self._col])
+
+    @flagged.setter
+    def flagged(self, value: bool) -> None:
+        self._board._set_flagged(self._row, self._col, value)
+
+    @property
+    def adjacent_mines(self) -> int:
+        """Count of mines in the 8 neighboring cells (range: 0-8)."""
+        return int(self._board.adjacent_mines[self._row, self._col])
+
+    @adjacent_mines.setter
+    def adjacent_mines(self, value: int) -> None:
+        self._board._set_adjacent_mines(self._row, self._col, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Cell, CellView)):
+            return NotImplemented
+        return (
+            self.mine == other.mine
+            and self.revealed == other.revealed
+            and self.flagged == other.flagged
+            and self.adjacent_mines == other.adjacent_mines
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CellView(mine={self.mine}, revealed={self.revealed}, "
+            f"flagged={self.flagged}, adjacent_mines={self.adjacent_mines})"
+        )
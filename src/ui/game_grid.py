@@ -1,34 +1,40 @@
 """
 Game Grid Module
 
-Creates and manages the grid of clickable cell buttons for the Mine Detector game.
+Draws the grid of clickable cells for the Mine Detector game on a single canvas.
 Handles mouse interactions and updates cell display based on game state.
 """
 
 import tkinter as tk
-from typing import Callable, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from src.game.board import Board
 
 
 class GameGrid:
     """
-    Manages the visual grid of cell buttons for the Mine Detector game.
+    Manages the visual grid of cells for the Mine Detector game.
 
-    This class creates a 2D grid of Tkinter buttons representing each cell
-    in the game board. It handles left-click (reveal) and right-click (flag)
-    interactions, and updates the visual appearance of cells based on their
-    state.
+    The whole board is drawn on one Tkinter Canvas rather than built from a
+    Button widget per cell. Each cell is two lightweight canvas items: an
+    image item showing one of two shared background sprites (raised or
+    sunken, bevel included) and a text item for the number, flag or mine.
+    Clicks are mapped to a cell from the pointer position. A 30x16 Expert
+    board is therefore one widget with one set of bindings instead of 480
+    buttons, each with its own geometry management, relief drawing and event
+    handling.
 
-    The grid uses Tkinter's grid layout manager for perfect alignment of cells.
-    Each cell button is sized to be square with the standard Windows Mine Detector
-    appearance (raised border for unrevealed, sunken for revealed).
+    Cells keep the standard Windows Mine Detector appearance: a raised bevel
+    for unrevealed cells, flat (sunken) for revealed ones.
+
+    There is no per-cell widget, so the former ``buttons`` attribute is
+    gone; use cell_appearance() to read back how a cell is drawn.
 
     Attributes:
         parent: The parent Tkinter widget (usually the main window).
         board: The game Board object containing cell data.
-        cell_size: The size of each cell button in pixels (default: 30).
-        buttons: 2D list of Tkinter button widgets indexed by [row][col].
+        cell_size: The size of each cell in pixels (default: 30).
+        canvas: The Canvas widget the cells are drawn on.
         on_cell_click: Optional callback function for left-click events.
         on_cell_right_click: Optional callback function for right-click events.
 
@@ -50,6 +56,43 @@ class GameGrid:
     }
     """Colors for numbers 1-8 matching the classic Windows Mine Detector appearance."""
 
+    # Appearance of each kind of cell, built once so drawing a cell picks a
+    # ready-made dict instead of rebuilding the options
+    FLAG_CONFIG = {"text": "🚩", "relief": "raised", "bg": "lightgray", "fg": "red"}
+    """Appearance of a flagged cell."""
+
+    MINE_CONFIG = {"text": "💣", "relief": "sunken", "bg": "#c0c0c0", "fg": "black"}
+    """Appearance of a revealed mine."""
+
+    BLANK_CONFIG = {"text": "", "relief": "sunken", "bg": "#c0c0c0", "fg": "black"}
+    """Appearance of a revealed cell with 0 adjacent mines."""
+
+    UNREVEALED_CONFIG = {
+        "text": "",
+        "relief": "raised",
+        "bg": "lightgray",
+        "fg": "black",
+    }
+    """Appearance of an unrevealed cell."""
+
+    NUMBER_CONFIGS = {
+        count: {"text": str(count), "relief": "sunken", "bg": "#c0c0c0", "fg": color}
+        for count, color in NUMBER_COLORS.items()
+    }
+    """Appearance of a revealed cell showing each adjacent count 1-8."""
+
+    FONT = ("Arial", 10, "bold")
+    """Font of the numbers, flags and mines drawn on the cells."""
+
+    BEVEL_LIGHT = "white"
+    """Color of the top and left edges of a raised cell."""
+
+    BEVEL_DARK = "#808080"
+    """Color of the bottom and right edges of a raised cell, and grid lines."""
+
+    BEVEL_WIDTH = 2
+    """Width in pixels of the bevel drawn around a raised cell."""
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -60,16 +103,15 @@ class GameGrid:
         is_input_allowed: Optional[Callable[[], bool]] = None,
     ):
         """
-        Initialize the game grid with clickable cell buttons.
+        Initialize the game grid and draw the board's cells.
 
-        Creates a grid of Tkinter buttons matching the board dimensions.
-        Each button is configured with square dimensions and bound to
-        mouse click event handlers.
+        Creates a canvas sized to the board dimensions, draws every cell on
+        it, and binds the mouse click event handlers once on the canvas.
 
         Args:
             parent: The parent Tkinter widget to contain the grid.
             board: The game Board object with cell data to display.
-            cell_size: Size of each cell button in pixels (default: 30).
+            cell_size: Size of each cell in pixels (default: 30).
             on_cell_click: Optional callback for left-click, receives (row, col).
             on_cell_right_click: Optional callback for right-click, receives (row, col).
             is_input_allowed: Optional callback that returns True if input is allowed.
@@ -89,7 +131,7 @@ class GameGrid:
         """The game Board object containing cell data."""
 
         self.cell_size = cell_size
-        """The size of each cell button in pixels."""
+        """The size of each cell in pixels."""
 
         self.on_cell_click = on_cell_click
         """Optional callback function for left-click events on cells."""
@@ -104,87 +146,209 @@ class GameGrid:
         # (disables clicks without changing appearance)
         self.input_enabled = True
         """Whether mouse input is currently allowed
-        (prevents clicks without disabling widgets)."""
+        (prevents clicks without changing the cells' appearance)."""
 
         # Create frame to hold the grid
         self.frame = tk.Frame(parent, relief="sunken", bd=2)
-        """The frame widget containing the grid of cell buttons."""
+        """The frame widget containing the cell canvas."""
+
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0, bd=0)
+        """The Canvas widget the cells are drawn on."""
+
+        self.canvas.pack()
+
+        # Background sprites shared by every cell, keyed by relief
+        self._sprites: Dict[str, tk.PhotoImage] = {
+            "raised": self._make_sprite(self.UNREVEALED_CONFIG["bg"], raised=True),
+            "sunken": self._make_sprite(self.BLANK_CONFIG["bg"], raised=False),
+        }
+        """Raised and sunken cell background images, drawn once per grid."""
+
+        self._sprite_looks: Dict[str, Tuple[str, str]] = {
+            str(self._sprites["raised"]): ("raised", self.UNREVEALED_CONFIG["bg"]),
+            str(self._sprites["sunken"]): ("sunken", self.BLANK_CONFIG["bg"]),
+        }
+        """(relief, bg) shown by each sprite, keyed by the Tk image name."""
+
+        # Canvas item ids of each cell, indexed by [row][col]. The items form
+        # a pool as large as the largest board shown so far; cells outside
+        # the current board are hidden rather than deleted
+        self._images: List[List[int]] = []
+        """Background image item of each cell."""
+
+        self._texts: List[List[int]] = []
+        """Text item of each cell (number, flag or mine)."""
 
-        # Initialize buttons storage
-        self.buttons: list[list[tk.Button]] = []
-        """2D list of Tkinter button widgets indexed by [row][col]."""
+        self._drawn: List[List[Optional[Dict[str, str]]]] = []
+        """Appearance dict last drawn on each cell, so redrawing an unchanged
+        cell skips the canvas calls."""
 
-        # Create the grid of buttons
+        self._pending_cells: Set[Tuple[int, int]] = set()
+        """Cells queued by update_cells_deferred, waiting for the next flush."""
+
+        self._flush_scheduled = False
+        """Whether an after_idle flush of _pending_cells is already queued."""
+
+        # Mouse events are bound once on the canvas and mapped to a cell
+        # from the pointer position
+        self.canvas.bind("<ButtonPress-1>", self._on_left_press)
+        self.canvas.bind("<ButtonPress-3>", self._on_right_press)
+
+        # Draw the grid of cells
         self._create_grid()
 
+    def _make_sprite(self, bg: str, raised: bool) -> tk.PhotoImage:
+        """
+        Draw one cell_size x cell_size cell background image.
+
+        Raised sprites get a light bevel along the top and left edges and a
+        dark one along the bottom and right; sunken sprites get a single dark
+        line along the top and left, which forms the grid lines between
+        revealed cells.
+
+        Args:
+            bg: Background color of the cell.
+            raised: Whether to draw the raised bevel.
+
+        Returns:
+            The sprite image, owned by the grid's canvas.
+        """
+        size = self.cell_size
+        sprite = tk.PhotoImage(master=self.canvas, width=size, height=size)
+        sprite.put(bg, to=(0, 0, size, size))
+        if raised:
+            width = self.BEVEL_WIDTH
+            sprite.put(self.BEVEL_LIGHT, to=(0, 0, size, width))
+            sprite.put(self.BEVEL_LIGHT, to=(0, 0, width, size))
+            sprite.put(self.BEVEL_DARK, to=(0, size - width, size, size))
+            sprite.put(self.BEVEL_DARK, to=(size - width, 0, size, size))
+        else:
+            sprite.put(self.BEVEL_DARK, to=(0, 0, size, 1))
+            sprite.put(self.BEVEL_DARK, to=(0, 0, 1, size))
+        return sprite
+
     def _create_grid(self) -> None:
         """
-        Create the 2D grid of clickable cell buttons.
-
-        This method generates a button for each cell in the board using
-        Tkinter's grid layout manager. Each button is configured with:
-        - Square dimensions (cell_size x cell_size)
-        - Raised relief for unrevealed appearance
-        - Event bindings for left-click and right-click
-        - Closure to capture row/col coordinates for callbacks
-        - Custom bindtags to disable native Tkinter button behavior
-
-        The buttons are stored in a 2D list for efficient access during updates.
-        """
-        # Clear existing buttons if any
-        self.buttons = []
-
-        # Create buttons for each cell
-        for row in range(self.board.rows):
-            button_row = []
-            for col in range(self.board.cols):
-                # Create button with closure to capture row/col
-                button = tk.Button(
-                    self.frame,
-                    width=2,
-                    height=1,
-                    relief="raised",
-                    bd=2,
-                    font=("Arial", 10, "bold"),
-                )
+        Lay out the canvas cells for the current board, reusing existing items.
+
+        Canvas items are pooled across boards. The pool only grows: when the
+        board is larger than the pool in either direction, the missing cells
+        are created, each as:
+        - An image item showing the shared raised sprite (switched to the
+          sunken sprite once revealed)
+        - A centered text item for the number, flag or mine
+
+        Every item is tagged with its row ("r<row>") and column ("c<col>"),
+        so cells outside the board are hidden a whole row or column per call.
+        Visible cells left revealed or flagged by the previous game are
+        reset to the unrevealed look; cells that already show it are not
+        touched. Starting a new game on the same difficulty therefore
+        creates no items and only redraws the cells the last game changed.
+
+        The item ids are stored in 2D lists for direct access during updates.
+        """
+        canvas = self.canvas
+        size = self.cell_size
+        rows, cols = self.board.rows, self.board.cols
+        self._pending_cells = set()
+
+        # Grow the pool to cover the board
+        pool_rows = max(rows, len(self._images))
+        pool_cols = max(cols, len(self._images[0]) if self._images else 0)
+        if pool_rows > len(self._images) or (
+            self._images and pool_cols > len(self._images[0])
+        ):
+            self._grow_pool(pool_rows, pool_cols)
+
+        # Show the cells of this board and hide the rest of the pool
+        canvas.itemconfigure("all", state="normal")
+        for row in range(rows, pool_rows):
+            canvas.itemconfigure(f"r{row}", state="hidden")
+        for col in range(cols, pool_cols):
+            canvas.itemconfigure(f"c{col}", state="hidden")
+        canvas.config(width=cols * size, height=rows * size)
+
+        # Reset the visible cells to unrevealed (skipped where already drawn so)
+        apply_cell_state = self._apply_cell_state
+        for row in range(rows):
+            for col in range(cols):
+                apply_cell_state(row, col, False, False, False, 0)
+
+    def _grow_pool(self, pool_rows: int, pool_cols: int) -> None:
+        """
+        Create the canvas items for pool cells that do not exist yet.
 
-                # Bind mouse events
-                # Use ButtonPress-1 for immediate response
-                # on left-click (fires on mouse down)
-                button.bind(
-                    "<ButtonPress-1>",
-                    lambda event, r=row, c=col: self._handle_left_press(r, c),
-                )
-                # Override native ButtonRelease-1 behavior using delayed execution
-                button.bind(
-                    "<ButtonRelease-1>",
-                    lambda event, r=row, c=col: self._ensure_sunken_state(r, c),
+        Args:
+            pool_rows: Number of rows the pool must cover.
+            pool_cols: Number of columns the pool must cover.
+        """
+        canvas = self.canvas
+        size = self.cell_size
+        half = size // 2
+        raised = self._sprites["raised"]
+
+        for row in range(pool_rows):
+            if row == len(self._images):
+                self._images.append([])
+                self._texts.append([])
+                self._drawn.append([])
+            image_row = self._images[row]
+            text_row = self._texts[row]
+            y = row * size
+            for col in range(len(image_row), pool_cols):
+                x = col * size
+                tags = (f"r{row}", f"c{col}")
+                image_row.append(
+                    canvas.create_image(x, y, image=raised, anchor="nw", tags=tags)
                 )
-                # Right-click for flagging (fires on mouse down)
-                button.bind(
-                    "<ButtonPress-3>",
-                    lambda event, r=row, c=col: self._handle_right_press(r, c),
+                text_row.append(
+                    canvas.create_text(
+                        x + half, y + half, text="", font=self.FONT, tags=tags
+                    )
                 )
+            self._drawn[row].extend(
+                [self.UNREVEALED_CONFIG] * (pool_cols - len(self._drawn[row]))
+            )
 
-                # Position button in grid
-                button.grid(row=row, column=col, padx=0, pady=0)
+    def _event_cell(self, event: tk.Event) -> Optional[Tuple[int, int]]:
+        """
+        Find the cell under the pointer for a mouse event on the canvas.
 
-                button_row.append(button)
-            self.buttons.append(button_row)
+        Args:
+            event: The Tkinter event, fired on the canvas.
 
-    def _handle_left_press(self, row: int, col: int):
+        Returns:
+            (row, col) of the cell, or None if the event fell outside the grid.
         """
-        Handle left-button press event on a cell button.
+        row = event.y // self.cell_size
+        col = event.x // self.cell_size
+        if not self.board.is_valid_coordinate(row, col):
+            return None
+        return row, col
+
+    def _on_left_press(self, event: tk.Event):
+        """Dispatch a left-button press on the canvas (fires on mouse down)."""
+        cell = self._event_cell(event)
+        if cell is None:
+            return "break"
+        return self._handle_left_press(*cell)
+
+    def _on_right_press(self, event: tk.Event):
+        """Dispatch a right-button press on the canvas (used for flagging)."""
+        cell = self._event_cell(event)
+        if cell is None:
+            return "break"
+        return self._handle_right_press(*cell)
 
-        This method is called when a cell button's left mouse button is
-        pressed (mouse down).
-        It checks if input is allowed (game is still active), then sets button to sunken
-        state for instant visual feedback and invokes on_cell_click callback.
-        The sunken state is maintained by the ButtonRelease-1 handler which
-        overrides the native button behavior.
+    def _handle_left_press(self, row: int, col: int):
+        """
+        Handle left-button press event on a cell.
 
-        This approach provides immediate visual response while working with
-        Tkinter's event system instead of blocking it.
+        This method is called when the left mouse button is pressed (mouse
+        down) over a cell. It checks if input is allowed (game is still
+        active), then draws the cell sunken for instant visual feedback and
+        invokes on_cell_click callback. Canvas items have no native press
+        behavior, so the sunken look stays until the cell is next redrawn.
 
         Args:
             row: Row index of the clicked cell (0-based).
@@ -198,10 +362,13 @@ class GameGrid:
         if not self.input_enabled:
             return "break"
 
-        # Immediately set button to sunken state for instant visual feedback
-        button = self.buttons[row][col]
-        button.config(relief="sunken", bg="#c0c0c0")
-        button.update_idletasks()
+        # Immediately draw the cell sunken for instant visual feedback.
+        # The cell no longer shows its last drawn state, so forget it and
+        # let the next update redraw the cell even if the click changed nothing
+        canvas = self.canvas
+        canvas.itemconfigure(self._images[row][col], image=self._sprites["sunken"])
+        self._drawn[row][col] = None
+        canvas.update_idletasks()
 
         if self.on_cell_click:
             self.on_cell_click(row, col)
@@ -210,10 +377,10 @@ class GameGrid:
 
     def _handle_right_press(self, row: int, col: int):
         """
-        Handle right-button press event on a cell button.
+        Handle right-button press event on a cell.
 
-        This method is called when a cell button's right mouse button is
-        pressed (mouse down).
+        This method is called when the right mouse button is pressed (mouse
+        down) over a cell.
         It checks if input is allowed (game is still active), then invokes the
         on_cell_right_click callback if one was provided during initialization.
         Right-click is used to place/remove flags on cells.
@@ -235,151 +402,143 @@ class GameGrid:
 
         return "break"
 
-        # Immediately set button to sunken state for instant visual feedback
-        button = self.buttons[row][col]
-        button.config(relief="sunken", bg="#c0c0c0")
-        button.update_idletasks()
-
-        if self.on_cell_click:
-            self.on_cell_click(row, col)
-
-        return "break"
-
-    def _handle_right_click(self, row: int, col: int):
+    def update_cell(self, row: int, col: int) -> None:
         """
-        Handle right-click event on a cell button.
+        Update the visual appearance of a single cell.
 
-        This method is called when a cell button is right-clicked. It checks if
-        input is allowed (game is still active), then invokes the
-        on_cell_right_click callback if one was provided during initialization.
-        Right-click is used to place/remove flags on cells.
+        Redraws the specified cell based on its current state in the board.
+        This handles all possible cell states:
+        - Unrevealed: Raised cell with no text
+        - Revealed mine: Sunken cell with mine symbol
+        - Revealed numbered: Sunken cell with number (1-8) in appropriate color
+        - Flagged: Raised cell with flag symbol
 
         Args:
-            row: Row index of the clicked cell (0-based).
-            col: Column index of the clicked cell (0-based).
-        """
-        # Check if input is allowed (game is still active)
-        if self.is_input_allowed and not self.is_input_allowed():
-            return
-
-        # Check internal input enabled flag
-        if not self.input_enabled:
-            return "break"
-
-        if self.on_cell_right_click:
-            self.on_cell_right_click(row, col)
-
-        return "break"
+            row: Row index of the cell to update (0-based).
+            col: Column index of the cell to update (0-based).
 
-    def _ensure_sunken_state(self, row: int, col: int) -> None:
+        Raises:
+            IndexError: If coordinates are out of bounds.
         """
-        Ensure the button stays in sunken state after native ButtonRelease handler.
-
-        This method is called after Tkinter's native ButtonRelease-1 handler runs.
-        The native handler resets the button to raised state, causing the "pop back up"
-        animation. This method overrides that behavior by re-applying the sunken state
-        for revealed cells, without blocking event propagation.
+        if not self.board.is_valid_coordinate(row, col):
+            raise IndexError(
+                f"Cannot update cell ({row}, {col}): "
+                f"out of bounds for board size ({self.board.rows}x{self.board.cols})"
+            )
 
-        This approach works with Tkinter's event system instead of against it:
-        - Native handler runs (button resets to raised)
-        - Our delayed handler runs (button set back to sunken if
-          revealed)
-        - No "break" needed, event chain completes normally
+        board = self.board
+        self._apply_cell_state(
+            row,
+            col,
+            bool(board.mine[row, col]),
+            bool(board.revealed[row, col]),
+            bool(board.flagged[row, col]),
+            int(board.adjacent_mines[row, col]),
+        )
+
+    def _apply_cell_state(
+        self,
+        row: int,
+        col: int,
+        mine: bool,
+        revealed: bool,
+        flagged: bool,
+        adjacent_mines: int,
+    ) -> None:
+        """
+        Draw a cell in the given cell state.
 
-        The use of after() ensures our handler runs AFTER the native
-        Button class handler, allowing us to override the visual state
-        without interfering with event propagation.
+        Shared by update_cell, update_cells and update_all_cells, which read
+        the state straight from the board arrays. The appearance last drawn on
+        each cell is remembered, and a cell already showing the requested
+        appearance is left alone: every canvas call is a round trip into Tcl,
+        and most cells are unchanged on a full refresh.
 
         Args:
             row: Row index of the cell (0-based).
             col: Column index of the cell (0-based).
+            mine: Whether the cell contains a mine.
+            revealed: Whether the cell has been revealed.
+            flagged: Whether the cell has been flagged.
+            adjacent_mines: Count of mines in the cell's 8 neighbors.
         """
-        # Check if input is allowed (game is still active)
-        if self.is_input_allowed and not self.is_input_allowed():
-            return
+        if flagged:
+            # Show flag
+            config = self.FLAG_CONFIG
+        elif revealed:
+            if mine:
+                # Revealed mine - show mine symbol
+                config = self.MINE_CONFIG
+            elif adjacent_mines > 0:
+                # Revealed numbered cell - show number with color
+                config = self.NUMBER_CONFIGS[adjacent_mines]
+            else:
+                # Revealed blank cell (0 adjacent mines)
+                config = self.BLANK_CONFIG
+        else:
+            # Unrevealed cell
+            config = self.UNREVEALED_CONFIG
 
-        # Check internal input enabled flag
-        if not self.input_enabled:
+        drawn_row = self._drawn[row]
+        drawn = drawn_row[col]
+        if drawn is config:
             return
+        drawn_row[col] = config
+
+        # Only touch the items whose look actually changes: revealing a blank
+        # cell is a single sprite swap, with the empty text left alone
+        canvas = self.canvas
+        if drawn is None or drawn["relief"] != config["relief"]:
+            canvas.itemconfigure(
+                self._images[row][col], image=self._sprites[config["relief"]]
+            )
+        if (
+            drawn is None
+            or drawn["text"] != config["text"]
+            or drawn["fg"] != config["fg"]
+        ):
+            canvas.itemconfigure(
+                self._texts[row][col], text=config["text"], fill=config["fg"]
+            )
 
-        # Schedule state correction after native handler completes
-        # Small delay ensures native ButtonRelease handler runs first
-        self.frame.after(1, lambda: self._apply_sunken_if_revealed(row, col))
-
-    def _apply_sunken_if_revealed(self, row: int, col: int) -> None:
+    def cell_appearance(self, row: int, col: int) -> Dict[str, str]:
         """
-        Apply sunken state to button if the cell is revealed.
-
-        This helper method is called after a delay by _ensure_sunken_state.
-        It checks if the cell should be sunken (revealed) and applies the
-        appropriate visual state.
+        Read back how a cell is currently drawn on the canvas.
 
         Args:
             row: Row index of the cell (0-based).
             col: Column index of the cell (0-based).
-        """
-        cell = self.board.get_cell(row, col)
-
-        # Only override if the cell is revealed (should be sunken)
-        # Don't interfere with unrevealed cells (should stay raised)
-        if cell.revealed:
-            button = self.buttons[row][col]
-            button.config(relief="sunken", bg="#c0c0c0")
-
-    def update_cell(self, row: int, col: int) -> None:
-        """
-        Update the visual appearance of a single cell.
-
-        Refreshes the display of the specified cell button based on its current
-        state in the board. This handles all possible cell states:
-        - Unrevealed: Raised button with no text
-        - Revealed mine: Sunken button with mine symbol
-        - Revealed numbered: Sunken button with number (1-8) in appropriate color
-        - Flagged: Raised button with flag symbol
 
-        Args:
-            row: Row index of the cell to update (0-based).
-            col: Column index of the cell to update (0-based).
+        Returns:
+            Dict with the cell's "text", "relief" ("raised" or "sunken"),
+            "bg" (background color) and "fg" (text color).
 
         Raises:
             IndexError: If coordinates are out of bounds.
         """
         if not self.board.is_valid_coordinate(row, col):
             raise IndexError(
-                f"Cannot update cell ({row}, {col}): "
+                f"Cannot read cell ({row}, {col}): "
                 f"out of bounds for board size ({self.board.rows}x{self.board.cols})"
             )
 
-        cell = self.board.get_cell(row, col)
-        button = self.buttons[row][col]
-
-        if cell.flagged:
-            # Show flag
-            button.config(text="🚩", relief="raised", bg="lightgray")
-        elif cell.revealed:
-            if cell.mine:
-                # Revealed mine - show mine symbol
-                button.config(text="💣", relief="sunken", bg="#c0c0c0")
-            elif cell.adjacent_mines > 0:
-                # Revealed numbered cell - show number with color
-                button.config(
-                    text=str(cell.adjacent_mines),
-                    relief="sunken",
-                    bg="#c0c0c0",
-                    fg=self.NUMBER_COLORS.get(cell.adjacent_mines, "black"),
-                )
-            else:
-                # Revealed blank cell (0 adjacent mines)
-                button.config(text="", relief="sunken", bg="#c0c0c0")
-        else:
-            # Unrevealed cell
-            button.config(text="", relief="raised", bg="lightgray")
+        canvas = self.canvas
+        relief, bg = self._sprite_looks[
+            canvas.itemcget(self._images[row][col], "image")
+        ]
+        text = self._texts[row][col]
+        return {
+            "text": canvas.itemcget(text, "text"),
+            "relief": relief,
+            "bg": bg,
+            "fg": canvas.itemcget(text, "fill"),
+        }
 
     def set_enabled(self, enabled: bool) -> None:
         """
         Enable or disable mouse input for the entire grid.
 
-        When disabled, mouse clicks are blocked but the visual appearance
+        When disabled, mouse clicks are ignored but the visual appearance
         remains unchanged. This is used to prevent interaction when
         the game is over without affecting the grid's color scheme.
 
@@ -388,27 +547,6 @@ class GameGrid:
         """
         self.input_enabled = enabled
 
-        # Disable the button widget to prevent native press animation
-        # Then immediately re-enable it to restore normal appearance
-        for row in range(self.board.rows):
-            for col in range(self.board.cols):
-                button = self.buttons[row][col]
-                if enabled:
-                    button.config(state="normal")
-                else:
-                    # Temporarily disable to block native press animation
-                    button.config(state="disabled")
-                    # Immediately restore colors to prevent grayscale
-                    current_relief = button.cget("relief")
-                    current_bg = button.cget("bg")
-                    current_fg = button.cget("fg")
-                    button.config(
-                        state="normal",
-                        relief=current_relief,
-                        bg=current_bg,
-                        fg=current_fg,
-                    )
-
     def update_all_cells(self) -> None:
         """
         Update the visual appearance of all cells in the grid.
@@ -416,20 +554,100 @@ class GameGrid:
         This method iterates through all cells and refreshes their display
         based on the current board state. Use this after batch operations
         that affect multiple cells (e.g., flood fill reveal, game over).
+
+        The board arrays are converted to nested lists once and bound to
+        locals, so the per-cell loop does no attribute chains, coordinate
+        validation or CellView lookups. Like update_cells, it only
+        reconfigures canvas items; Tk repaints them all in one pass once
+        control returns to the event loop.
         """
-        for row in range(self.board.rows):
-            for col in range(self.board.cols):
-                self.update_cell(row, col)
-        # Force immediate UI update to ensure visual changes take effect
-        self.frame.update_idletasks()
+        board = self.board
+        apply_cell_state = self._apply_cell_state
+        mine = board.mine.tolist()
+        revealed = board.revealed.tolist()
+        flagged = board.flagged.tolist()
+        adjacent_mines = board.adjacent_mines.tolist()
+
+        for row in range(board.rows):
+            mine_row = mine[row]
+            revealed_row = revealed[row]
+            flagged_row = flagged[row]
+            adjacent_row = adjacent_mines[row]
+            for col in range(board.cols):
+                apply_cell_state(
+                    row,
+                    col,
+                    mine_row[col],
+                    revealed_row[col],
+                    flagged_row[col],
+                    adjacent_row[col],
+                )
+
+    def update_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Update the visual appearance of just the given cells.
+
+        Use this after an operation whose changed cells are known (see
+        Board.take_dirty_cells): a click that reveals a handful of cells
+        redraws only those cells instead of every cell on the board. No
+        repaint is forced, so a whole flood fill appears in a single frame
+        when Tk next goes idle.
+
+        Args:
+            cells: (row, col) coordinates of the cells to refresh.
+        """
+        board = self.board
+        apply_cell_state = self._apply_cell_state
+        mine = board.mine
+        revealed = board.revealed
+        flagged = board.flagged
+        adjacent_mines = board.adjacent_mines
+
+        for row, col in cells:
+            apply_cell_state(
+                row,
+                col,
+                bool(mine[row, col]),
+                bool(revealed[row, col]),
+                bool(flagged[row, col]),
+                int(adjacent_mines[row, col]),
+            )
+
+    def update_cells_deferred(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Queue cells to be redrawn together once Tk is next idle.
+
+        Every call before the flush adds to one pending set, and only the
+        first schedules an after_idle callback, so a burst of updates (e.g.
+        several flags toggled between two idle points) costs a single pass
+        over the distinct cells instead of one event-loop turn per cell.
+
+        Args:
+            cells: (row, col) coordinates of the cells to refresh.
+        """
+        self._pending_cells.update(cells)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.frame.after_idle(self._flush_pending_cells)
+
+    def _flush_pending_cells(self) -> None:
+        """Redraw every cell queued by update_cells_deferred since the last flush."""
+        self._flush_scheduled = False
+        cells, self._pending_cells = self._pending_cells, set()
+        self.update_cells(cells)
+
+    def update_dirty_cells(self) -> None:
+        """Redraw the cells the board has changed since the last redraw."""
+        self.update_cells(self.board.take_dirty_cells())
 
     def resize(self, new_board: Board) -> None:
         """
         Resize the grid to match a new board configuration.
 
-        This method destroys all existing buttons and recreates the grid
-        with the dimensions of the new board. Use this when switching
-        difficulty levels or starting a new game.
+        The canvas items are reused rather than recreated (see
+        _create_grid), so only cells the new board does not already show
+        correctly are redrawn. Use this when switching difficulty levels or
+        starting a new game.
 
         Args:
             new_board: The new Board object with updated dimensions.
@@ -443,12 +661,7 @@ class GameGrid:
         # Update board reference
         self.board = new_board
 
-        # Clear existing buttons
-        for row in self.buttons:
-            for button in row:
-                button.destroy()
-
-        # Recreate grid with new dimensions
+        # Lay out the pooled cells for the new dimensions
         self._create_grid()
 
     def pack(self, **kwargs) -> None:
@@ -6,8 +6,10 @@ Provides difficulty selection via Game menu and sets up the main application str
 """
 
 import tkinter as tk
-from typing import Dict, Optional
+from functools import partial
+from typing import Dict, NamedTuple, Optional
 
+from src.game import flood_fill_nb
 from src.game.board import Board
 from src.models.game_state import GameState
 from src.ui.game_grid import GameGrid
@@ -16,6 +18,19 @@ from src.ui.reset_button import ResetButton
 from src.ui.timer import GameTimer
 
 
+class DiffConfig(NamedTuple):
+    """Grid configuration of a difficulty level."""
+
+    rows: int
+    """Number of rows in the grid."""
+
+    cols: int
+    """Number of columns in the grid."""
+
+    mines: int
+    """Number of mines on the board."""
+
+
 class MainWindow:
     """
     The main application window for the Mine Detector game.
@@ -50,10 +65,10 @@ class MainWindow:
 
     # Difficulty configurations as class constants
     # Following Windows Mine Detector standard difficulties
-    DIFFICULTIES: Dict[str, Dict[str, int]] = {
-        "Beginner": {"rows": 9, "cols": 9, "mines": 10},
-        "Intermediate": {"rows": 16, "cols": 16, "mines": 40},
-        "Expert": {"rows": 16, "cols": 30, "mines": 99},
+    DIFFICULTIES: Dict[str, DiffConfig] = {
+        "Beginner": DiffConfig(rows=9, cols=9, mines=10),
+        "Intermediate": DiffConfig(rows=16, cols=16, mines=40),
+        "Expert": DiffConfig(rows=16, cols=30, mines=99),
     }
     """Dictionary mapping difficulty names to their grid configurations."""
 
@@ -82,8 +97,8 @@ class MainWindow:
         self._create_menu()
 
         # Initialize game board
-        config = self.get_difficulty_config()
-        self.board = Board(config["rows"], config["cols"], config["mines"])
+        config = self.DIFFICULTIES[self.current_difficulty]
+        self.board = Board(config.rows, config.cols, config.mines)
         """The game Board object containing cell data and game logic."""
 
         # Initialize game grid UI
@@ -108,12 +123,23 @@ class MainWindow:
         self.first_click_made = False
         """Whether the first cell has been revealed (timer starts on first click)."""
 
+        self._happy_after_id: Optional[str] = None
+        """after_idle id of a pending restore to the happy face, or None."""
+
         # Create the top frame for mine counter, reset button, and timer
         self._create_top_frame()
 
         # Create the game grid
         self._create_game_grid()
 
+        # Run the pending geometry and redraw work now, so the first frame's
+        # layout cost is paid at startup rather than on the first click
+        self.root.update_idletasks()
+
+        # Compile this board's flood fill kernel once the window is up,
+        # rather than on the first click
+        self.root.after_idle(flood_fill_nb.warm_up, config.rows, config.cols)
+
     def _create_menu(self) -> None:
         """
         Create the Game menu with difficulty selection options.
@@ -136,16 +162,11 @@ class MainWindow:
         game_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Game", menu=game_menu)
 
-        # Add difficulty options
-        game_menu.add_command(
-            label="Beginner", command=lambda: self._set_difficulty("Beginner")
-        )
-        game_menu.add_command(
-            label="Intermediate", command=lambda: self._set_difficulty("Intermediate")
-        )
-        game_menu.add_command(
-            label="Expert", command=lambda: self._set_difficulty("Expert")
-        )
+        # Add difficulty options, one per configured difficulty in order
+        for difficulty in self.DIFFICULTIES:
+            game_menu.add_command(
+                label=difficulty, command=partial(self._set_difficulty, difficulty)
+            )
 
         # Add separator
         game_menu.add_separator()
@@ -205,13 +226,14 @@ class MainWindow:
         """
         Handle left-click event on a cell.
 
-        This callback is invoked when a cell button is left-clicked. It handles
+        This callback is invoked when a cell is left-clicked. It handles
         three scenarios:
         1. First click: Places mines (with first-click safety), then reveals cell
         2. Clicking revealed numbered cell: Attempts chording if flags match number
         3. Clicking unrevealed cell: Reveals the cell (triggers flood fill if blank)
 
-        After each reveal, checks for win/loss conditions and updates the UI.
+        After each click, checks for win/loss conditions and redraws the
+        cells the click changed.
 
         Args:
             row: Row index of the clicked cell (0-based).
@@ -224,8 +246,6 @@ class MainWindow:
         # Show shocked face while clicking
         self._set_face_shocked()
 
-        cell = self.board.get_cell(row, col)
-
         # Handle first click (mine placement with first-click safety)
         if not self.first_click_made:
             self.first_click_made = True
@@ -233,35 +253,38 @@ class MainWindow:
                 self.timer.start()
             # Place mines after first click to ensure safety
             self.board.place_mines(row, col)
-            # Re-fetch the cell after mine placement (adjacent_mines may have changed)
-            cell = self.board.get_cell(row, col)
 
         # Handle chording on revealed numbered cells
-        if cell.revealed and cell.adjacent_mines > 0:
-            # Attempt chording
-            self.board.chord_cell(row, col)
-        # Handle revealing unrevealed cells
-        elif not cell.revealed:
-            # Don't reveal flagged cells
-            if not cell.flagged:
-                self.board.reveal_cell(row, col)
-
-        # Update all cell displays (flood fill may have revealed many cells)
-        if self.game_grid:
-            self.game_grid.update_all_cells()
-
-        # Check game state and update UI
+        if self.board.revealed[row, col]:
+            if self.board.adjacent_mines[row, col] > 0:
+                self.board.chord_cell(row, col)
+        # Handle revealing unrevealed cells (flagged cells are not revealed)
+        elif not self.board.flagged[row, col]:
+            self.board.reveal_cell(row, col)
+
+        # Check game state and update UI first, so the mines revealed on a
+        # loss are redrawn in the same pass as the losing click
         self._check_game_state()
 
-        # Reset face to happy if game is still playing
-        if self.board.game_state == GameState.PLAYING:
-            self._set_face_happy()
+        # Redraw the cells the click changed, plus any the game-over handling
+        # changed, in one pass. The clicked cell was sunk on mouse down, so it
+        # is redrawn even when the click changed nothing (e.g. a flagged cell)
+        if self.game_grid:
+            changed_cells = self.board.take_dirty_cells()
+            changed_cells.append((row, col))
+            self.game_grid.update_cells(changed_cells)
+
+        # Reset face to happy once the UI is idle, if game is still playing.
+        # A click arriving first cancels the restore, so rapid clicking keeps
+        # the shocked face instead of flipping it back and forth
+        if self.board.game_state is GameState.PLAYING and self._happy_after_id is None:
+            self._happy_after_id = self.root.after_idle(self._restore_face_happy)
 
     def _on_cell_right_click(self, row: int, col: int) -> None:
         """
         Handle right-click event on a cell.
 
-        This callback is invoked when a cell button is right-clicked.
+        This callback is invoked when a cell is right-clicked.
         Toggles the flag state of the cell and updates the mine counter
         accordingly. If a flag is placed, the counter decrements; if a
         flag is removed, the counter increments.
@@ -281,21 +304,16 @@ class MainWindow:
         if cell.revealed:
             return
 
-        # Toggle flag state
-        if cell.flagged:
-            # Remove flag
-            cell.flagged = False
-            if self.mine_counter:
-                self.mine_counter.increment()
-        else:
-            # Place flag
-            cell.flagged = True
-            if self.mine_counter:
-                self.mine_counter.decrement()
+        # Toggle flag state; removing a flag adds one to the remaining count,
+        # placing one takes one away
+        flagged = not cell.flagged
+        cell.flagged = flagged
+        if self.mine_counter:
+            self.mine_counter.apply_delta(-1 if flagged else 1)
 
-        # Update the cell display
+        # Update the cell display, coalesced with any other pending redraws
         if self.game_grid:
-            self.game_grid.update_cell(row, col)
+            self.game_grid.update_cells_deferred(self.board.take_dirty_cells())
 
     def _is_input_allowed(self) -> bool:
         """
@@ -308,7 +326,7 @@ class MainWindow:
         Returns:
             True if input is allowed (game is playing), False otherwise.
         """
-        return bool(self.board.game_state == GameState.PLAYING)
+        return self.board.game_state is GameState.PLAYING
 
     def _check_game_state(self) -> None:
         """
@@ -341,7 +359,7 @@ class MainWindow:
         - Stops the timer
         - Updates the reset button face icon (cool for win, dead for loss)
         - Reveals all mine positions on loss
-        - Disables all cell buttons to prevent further interaction
+        - Disables cell input to prevent further interaction
 
         Args:
             won: True if the game was won, False if lost.
@@ -350,7 +368,8 @@ class MainWindow:
         if self.timer:
             self.timer.stop()
 
-        # Update face icon
+        # Update face icon, dropping any pending restore to happy
+        self._cancel_face_happy()
         if won:
             self._set_face_cool()
         else:
@@ -358,7 +377,7 @@ class MainWindow:
             # Reveal all mines on loss
             self._reveal_all_mines()
 
-        # Disable all cell buttons to prevent further interaction
+        # Disable cell input to prevent further interaction
         if self.game_grid:
             self.game_grid.set_enabled(False)
 
@@ -367,19 +386,12 @@ class MainWindow:
         Reveal all mine positions on the board.
 
         This method is called when the game is lost to show the player
-        where all the mines were located. It updates the visual display
-        of all mine cells.
+        where all the mines were located. The newly revealed mines are left
+        in the board's dirty cells, so _on_cell_click redraws them together
+        with the losing click rather than in a second pass.
         """
         # Reveal all mine cells
-        for row in range(self.board.rows):
-            for col in range(self.board.cols):
-                cell = self.board.get_cell(row, col)
-                if cell.mine:
-                    cell.revealed = True
-
-        # Update the grid display
-        if self.game_grid:
-            self.game_grid.update_all_cells()
+        self.board.reveal_mines()
 
     def _set_difficulty(self, difficulty: str) -> None:
         """
@@ -414,6 +426,10 @@ class MainWindow:
         # Reset the game with new difficulty settings
         self._reset_game()
 
+        # Compile the flood fill kernel for the new board shape while idle
+        config = self.DIFFICULTIES[difficulty]
+        self.root.after_idle(flood_fill_nb.warm_up, config.rows, config.cols)
+
     def _reset_game(self) -> None:
         """
         Reset the game to initial state.
@@ -426,18 +442,18 @@ class MainWindow:
         mine positions and resets all game state.
         """
         # Create new board with same difficulty settings
-        config = self.get_difficulty_config()
-        self.board = Board(config["rows"], config["cols"], config["mines"])
+        config = self.DIFFICULTIES[self.current_difficulty]
+        self.board = Board(config.rows, config.cols, config.mines)
 
         # Resize the game grid to match new board
         if self.game_grid:
             self.game_grid.resize(self.board)
-            # Re-enable cell buttons for new game
+            # Re-enable cell input for new game
             self.game_grid.set_enabled(True)
 
         # Reset mine counter to total mines
         if self.mine_counter:
-            self.mine_counter.reset(new_total=config["mines"])
+            self.mine_counter.reset(new_total=config.mines)
 
         # Reset timer to 0
         if self.timer:
@@ -447,9 +463,21 @@ class MainWindow:
         self.first_click_made = False
 
         # Reset button face to happy
+        self._cancel_face_happy()
         if self.reset_button:
             self.reset_button.set_happy()
 
+    def _cancel_face_happy(self) -> None:
+        """Cancel a pending after_idle restore to the happy face, if any."""
+        if self._happy_after_id is not None:
+            self.root.after_cancel(self._happy_after_id)
+            self._happy_after_id = None
+
+    def _restore_face_happy(self) -> None:
+        """after_idle callback: switch back to the happy face after a click."""
+        self._happy_after_id = None
+        self._set_face_happy()
+
     def _set_face_happy(self) -> None:
         """
         Set the reset button face to happy (playing state).
@@ -465,8 +493,10 @@ class MainWindow:
         Set the reset button face to shocked (clicking state).
 
         The shocked face is displayed momentarily when the player is
-        clicking on a cell, providing visual feedback.
+        clicking on a cell, providing visual feedback. A pending restore to
+        the happy face from an earlier click is cancelled.
         """
+        self._cancel_face_happy()
         if self.reset_button:
             self.reset_button.set_shocked()
 
@@ -491,22 +521,22 @@ class MainWindow:
         if self.reset_button:
             self.reset_button.set_cool()
 
-    def get_difficulty_config(self) -> Dict[str, int]:
+    def get_difficulty_config(self) -> DiffConfig:
         """
         Get the configuration for the current difficulty level.
 
-        Returns a dictionary containing the rows, columns, and mine count
-        for the currently selected difficulty.
+        Returns the rows, columns, and mine count for the currently selected
+        difficulty.
 
         Returns:
-            Dictionary with keys 'rows', 'cols', and 'mines' representing
-            the current difficulty configuration.
+            DiffConfig with fields rows, cols, and mines representing the
+            current difficulty configuration.
 
         Example:
             >>> window = MainWindow()
             >>> window._set_difficulty("Intermediate")
             >>> config = window.get_difficulty_config()
-            >>> print(config['rows'], config['cols'], config['mines'])
+            >>> print(config.rows, config.cols, config.mines)
             16 16 40
         """
         return self.DIFFICULTIES[self.current_difficulty]
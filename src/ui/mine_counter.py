@@ -6,7 +6,7 @@ Shows the number of remaining mines (total mines minus placed flags).
 """
 
 import tkinter as tk
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.game.board import Board
 
@@ -44,6 +44,9 @@ class MineCounter:
     MIN_DISPLAY = -999
     """Minimum value that can be displayed on the counter."""
 
+    DISPLAY_STRINGS = tuple(f"{i:03d}" for i in range(MIN_DISPLAY, MAX_DISPLAY + 1))
+    """Formatted text of every displayable count, indexed by count - MIN_DISPLAY."""
+
     def __init__(
         self, parent: tk.Widget, board: Board, total_mines: Optional[int] = None
     ):
@@ -79,10 +82,20 @@ class MineCounter:
         self.current_count = self.total_mines
         """The current remaining mine count being displayed."""
 
+        # The label shows this variable, so count changes only set the
+        # variable instead of reconfiguring the label
+        self._text_var = tk.StringVar(
+            master=parent, value=self._format_display(self.current_count)
+        )
+        """Text shown on the label, bound to it as its textvariable."""
+
+        self._negative = self.current_count < 0
+        """Whether the label currently has the negative-count colors."""
+
         # Create the counter label with LCD-style appearance
         self.label = tk.Label(
             parent,
-            text=str(self._format_display(self.current_count)),
+            textvariable=self._text_var,
             font=("Courier", 20, "bold"),
             width=4,
             relief="sunken",
@@ -98,7 +111,9 @@ class MineCounter:
         Format the count for display, clamping to valid range.
 
         The counter can only display values between -999 and 999.
-        Values outside this range are clamped to the nearest bound.
+        Values outside this range are clamped to the nearest bound. The
+        strings are looked up in DISPLAY_STRINGS, built once for the whole
+        range, rather than formatted on every flag toggle.
 
         Args:
             count: The raw count value to format.
@@ -108,21 +123,26 @@ class MineCounter:
         """
         # Clamp to display range
         clamped = max(self.MIN_DISPLAY, min(self.MAX_DISPLAY, count))
-        return f"{clamped:03d}"  # Zero-padded to 3 digits
+        return self.DISPLAY_STRINGS[clamped - self.MIN_DISPLAY]  # Zero-padded
 
-    def _update_colors(self) -> None:
+    def _colors(self) -> Tuple[str, str]:
         """
-        Update the label colors based on current count value.
+        Return the (fg, bg) label colors for the current count value.
 
         Positive counts (normal): Black text on red background
         Negative counts (too many flags): Red text on black background
         """
         if self.current_count >= 0:
             # Normal: black on red
-            self.label.config(fg="black", bg="#ff0000")
-        else:
-            # Too many flags: red on black
-            self.label.config(fg="red", bg="black")
+            return "black", "#ff0000"
+        # Too many flags: red on black
+        return "red", "black"
+
+    def _update_colors(self) -> None:
+        """Update the label colors based on current count value."""
+        self._negative = self.current_count < 0
+        fg, bg = self._colors()
+        self.label.config(fg=fg, bg=bg)
 
     def decrement(self) -> None:
         """
@@ -147,6 +167,19 @@ class MineCounter:
         self.current_count += 1
         self._update_display()
 
+    def apply_delta(self, delta: int) -> None:
+        """
+        Adjust the counter by delta and redraw it in one label update.
+
+        Lets a flag toggle change the count by +1 (flag removed) or -1 (flag
+        placed) without branching on which of increment/decrement to call.
+
+        Args:
+            delta: Amount to add to the remaining mine count.
+        """
+        self.current_count += delta
+        self._update_display()
+
     def reset(self, new_total: Optional[int] = None) -> None:
         """
         Reset the counter to initial mine count.
@@ -168,15 +201,14 @@ class MineCounter:
         """
         Update the counter display and colors.
 
-        Refreshes the label text with the current count and updates
-        the foreground/background colors based on whether the count
-        is positive or negative.
+        Refreshes the label text with the current count through its text
+        variable. The foreground/background colors depend only on whether
+        the count is negative, so the label is only reconfigured when the
+        count crosses zero.
         """
-        # Update text with formatted count
-        self.label.config(text=str(self._format_display(self.current_count)))
-
-        # Update colors based on new count
-        self._update_colors()
+        self._text_var.set(self._format_display(self.current_count))
+        if (self.current_count < 0) != self._negative:
+            self._update_colors()
 
     def set_count(self, count: int) -> None:
         """
@@ -49,8 +49,16 @@ class ResetButton:
     FACE_COOL = "😎"
     """Cool face icon for game won state."""
 
+    FACES = {
+        "happy": FACE_HAPPY,
+        "shocked": FACE_SHOCKED,
+        "dead": FACE_DEAD,
+        "cool": FACE_COOL,
+    }
+    """Face icon shown for each face state name."""
+
     # Face state names for validation
-    VALID_STATES = {"happy", "shocked", "dead", "cool"}
+    VALID_STATES = set(FACES)
     """Set of valid face state names."""
 
     def __init__(
@@ -59,9 +67,11 @@ class ResetButton:
         """
         Initialize the reset button with reactive face icons.
 
-        Creates a button widget with the happy face icon (default playing state).
-        The button is sized to display emoji clearly and is configured with
-        standard Windows Mine Detector button styling.
+        Only the parameters are stored here. The button widget is created
+        the first time the button is placed with pack() or grid() (see
+        _ensure_widget), so constructing and driving the face state machine
+        does no Tk work. Until then face changes only update current_state,
+        and the button starts out showing that face.
 
         Args:
             parent: The parent Tkinter widget to contain the button.
@@ -83,18 +93,39 @@ class ResetButton:
         self.current_state = "happy"
         """The current face state being displayed."""
 
-        # Create the button with happy face as default
-        self.button = tk.Button(
-            parent,
-            text=self.FACE_HAPPY,
-            font=("Segoe UI Emoji", 24),
-            width=3,
-            height=1,
-            relief="raised",
-            bd=2,
-            command=self._handle_click,
-        )
-        """The Tkinter button widget displaying the face icon."""
+        self._button: Optional[tk.Button] = None
+        """The Tkinter button widget, once created (see the button property)."""
+
+    @property
+    def button(self) -> tk.Button:
+        """The Tkinter button widget displaying the face icon.
+
+        Accessing it creates the widget if it does not exist yet.
+        """
+        return self._ensure_widget()
+
+    def _ensure_widget(self) -> tk.Button:
+        """
+        Create the button widget, if not done yet.
+
+        The button is sized to display emoji clearly and is configured with
+        standard Windows Mine Detector button styling.
+
+        Returns:
+            The button widget, showing the face of current_state.
+        """
+        if self._button is None:
+            self._button = tk.Button(
+                self.parent,
+                text=self.FACES[self.current_state],
+                font=("Segoe UI Emoji", 24),
+                width=3,
+                height=1,
+                relief="raised",
+                bd=2,
+                command=self._handle_click,
+            )
+        return self._button
 
     def _handle_click(self) -> None:
         """
@@ -105,10 +136,13 @@ class ResetButton:
         was provided, and finally resets the face to happy.
 
         The shocked state provides visual feedback during the click action,
-        mimicking the classic Windows Mine Detector behavior.
+        mimicking the classic Windows Mine Detector behavior. It is skipped
+        while the button is not viewable (e.g. the window is withdrawn), since
+        nobody could see it.
         """
         # Show shocked face momentarily
-        self.set_shocked()
+        if self._ensure_widget().winfo_viewable():
+            self.set_shocked()
 
         # Invoke reset callback if provided
         if self.on_reset:
@@ -124,8 +158,7 @@ class ResetButton:
         The happy face (🙂) is displayed during normal gameplay when the game
         is in progress and the player is not currently clicking a cell.
         """
-        self.current_state = "happy"
-        self.button.config(text=self.FACE_HAPPY)
+        self._show_face("happy")
 
     def set_shocked(self) -> None:
         """
@@ -135,8 +168,7 @@ class ResetButton:
         on a cell, providing visual feedback for the click action. This state
         is typically shown during mouse button press and reverted after release.
         """
-        self.current_state = "shocked"
-        self.button.config(text=self.FACE_SHOCKED)
+        self._show_face("shocked")
 
     def set_dead(self) -> None:
         """
@@ -145,8 +177,7 @@ class ResetButton:
         The dead face (😵) is displayed when the game is lost (a mine was
         clicked). This state persists until the game is reset.
         """
-        self.current_state = "dead"
-        self.button.config(text=self.FACE_DEAD)
+        self._show_face("dead")
 
     def set_cool(self) -> None:
         """
@@ -155,8 +186,25 @@ class ResetButton:
         The cool face (😎) is displayed when the game is won (all non-mine
         cells have been revealed). This state persists until the game is reset.
         """
-        self.current_state = "cool"
-        self.button.config(text=self.FACE_COOL)
+        self._show_face("cool")
+
+    def _show_face(self, state: str) -> None:
+        """
+        Switch the button to the face of a state.
+
+        The button is only reconfigured when the face actually changes, so
+        repeated calls for the face already shown (e.g. set_happy after every
+        click) cost no Tk round-trip. Before the button exists only
+        current_state is updated.
+
+        Args:
+            state: The face state to show (a key of FACES).
+        """
+        if state == self.current_state:
+            return
+        self.current_state = state
+        if self._button is not None:
+            self._button.config(text=self.FACES[state])
 
     def set_state(self, state: str) -> None:
         """
@@ -178,14 +226,7 @@ class ResetButton:
                 f"Must be one of {list(self.VALID_STATES)}"
             )
 
-        if state == "happy":
-            self.set_happy()
-        elif state == "shocked":
-            self.set_shocked()
-        elif state == "dead":
-            self.set_dead()
-        elif state == "cool":
-            self.set_cool()
+        self._show_face(state)
 
     def get_state(self) -> str:
         """
@@ -202,22 +243,24 @@ class ResetButton:
         """
         Pack the button into the parent widget.
 
-        This is a convenience method that delegates to the button's pack method,
+        This is a convenience method that creates the button on first use and
+        delegates to its pack method,
         allowing the reset button to be easily positioned in the main window.
 
         Args:
             **kwargs: Keyword arguments to pass to button.pack().
         """
-        self.button.pack(**kwargs)
+        self._ensure_widget().pack(**kwargs)
 
     def grid(self, **kwargs) -> None:
         """
         Grid the button into the parent widget.
 
-        This is a convenience method that delegates to the button's grid method,
+        This is a convenience method that creates the button on first use and
+        delegates to its grid method,
         allowing the reset button to be easily positioned in the main window.
 
         Args:
             **kwargs: Keyword arguments to pass to button.grid().
         """
-        self.button.grid(**kwargs)
+        self._ensure_widget().grid(**kwargs)
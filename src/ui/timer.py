@@ -5,7 +5,9 @@ Creates and manages the game timer for the Mine Detector game.
 Counts up from 0 starting on the first cell reveal, stops on game end.
 """
 
+import time
 import tkinter as tk
+from functools import partial
 from typing import Optional
 
 
@@ -22,11 +24,16 @@ class GameTimer:
     - Elapsed time in seconds (0-999)
     - Clamps at 999 for games longer than 999 seconds
 
+    Elapsed time is measured against time.monotonic() rather than by
+    counting after() callbacks, so late callbacks (a busy event loop, timer
+    slack) never make the count drift: each update reads the true elapsed
+    time and schedules the next one for the following whole-second boundary.
+
     Attributes:
         parent: The parent Tkinter widget (usually the main window).
         elapsed_seconds: The number of seconds elapsed since timer started.
         is_running: Whether the timer is currently running.
-        timer_id: The Tkinter after() callback ID (for canceling updates).
+        timer_id: The Tkinter after() callback ID of the pending update, or None.
 
     Example:
         >>> timer = GameTimer(parent_window)
@@ -39,6 +46,9 @@ class GameTimer:
     MAX_DISPLAY = 999
     """Maximum value that can be displayed on the timer (16.65 minutes)."""
 
+    DISPLAY_STRINGS = tuple(f"{i:03d}" for i in range(MAX_DISPLAY + 1))
+    """Formatted text of every displayable number of seconds, indexed by value."""
+
     # Timer update interval in milliseconds
     UPDATE_INTERVAL = 1000
     """Number of milliseconds between timer updates (1 second)."""
@@ -47,9 +57,10 @@ class GameTimer:
         """
         Initialize the game timer display.
 
-        Creates a label widget with LCD-style appearance showing the
-        elapsed time in seconds. The timer starts at 0 and is not
-        running until start() is called.
+        The timer starts at 0 and is not running until start() is called.
+        The LCD-style label showing the elapsed time in seconds is created
+        the first time the timer is placed with pack() or grid() (see
+        _ensure_widget), so constructing the timer does no Tk work.
 
         Args:
             parent: The parent Tkinter widget to contain the timer.
@@ -63,6 +74,9 @@ class GameTimer:
         self.parent = parent
         """The parent Tkinter widget containing this timer."""
 
+        self._after = parent.after
+        """parent.after, bound once rather than looked up on every tick."""
+
         # Initialize timer state
         self.elapsed_seconds = 0
         """The number of seconds elapsed since the timer started."""
@@ -71,20 +85,55 @@ class GameTimer:
         """Whether the timer is currently counting up."""
 
         self.timer_id: Optional[str] = None
-        """The Tkinter after() callback ID, used to cancel scheduled updates."""
-
-        # Create the timer label with LCD-style appearance
-        self.label = tk.Label(
-            parent,
-            text=self._format_display(self.elapsed_seconds),
-            font=("Courier", 20, "bold"),
-            width=4,
-            relief="sunken",
-            bd=2,
-            fg="black",
-            bg="#ff0000",
-        )
-        """The Tkinter label widget displaying the elapsed time."""
+        """The Tkinter after() callback ID of the pending update, or None."""
+
+        self._start_time = 0.0
+        """time.monotonic() value at which elapsed_seconds was 0."""
+
+        self._generation = 0
+        """Bumped by stop(); scheduled updates from an older generation are stale."""
+
+        self._last_text = self._format_display(self.elapsed_seconds)
+        """Text the label shows (or will show once created)."""
+
+        self._text_var: Optional[tk.StringVar] = None
+        """Text shown on the label, bound to it as its textvariable."""
+
+        self._label: Optional[tk.Label] = None
+        """The Tkinter label widget, once created (see the label property)."""
+
+    @property
+    def label(self) -> tk.Label:
+        """The Tkinter label widget displaying the elapsed time.
+
+        Accessing it creates the widget if it does not exist yet.
+        """
+        return self._ensure_widget()
+
+    def _ensure_widget(self) -> tk.Label:
+        """
+        Create the label widget and its text variable, if not done yet.
+
+        Returns:
+            The label widget, showing the current elapsed time.
+        """
+        if self._label is None:
+            # The label shows this variable, so each tick only sets the
+            # variable instead of reconfiguring the label
+            self._text_var = tk.StringVar(master=self.parent, value=self._last_text)
+
+            # Create the timer label with LCD-style appearance
+            self._label = tk.Label(
+                self.parent,
+                textvariable=self._text_var,
+                font=("Courier", 20, "bold"),
+                width=4,
+                relief="sunken",
+                bd=2,
+                fg="black",
+                bg="#ff0000",
+            )
+        return self._label
 
     def _format_display(self, seconds: int) -> str:
         """
@@ -92,6 +141,8 @@ class GameTimer:
 
         The timer can only display values between 0 and 999 seconds.
         Values above 999 are clamped to 999 (the Windows Mine Detector limit).
+        The strings are looked up in DISPLAY_STRINGS, built once for the whole
+        range, rather than formatted on every tick.
 
         Args:
             seconds: The raw elapsed time in seconds to format.
@@ -100,8 +151,7 @@ class GameTimer:
             The formatted time as a string (clamped to display range).
         """
         # Clamp to maximum display value
-        clamped = min(self.MAX_DISPLAY, seconds)
-        return f"{clamped:03d}"  # Zero-padded to 3 digits
+        return self.DISPLAY_STRINGS[min(self.MAX_DISPLAY, seconds)]  # Zero-padded
 
     def start(self) -> None:
         """
@@ -112,15 +162,17 @@ class GameTimer:
         (prevents multiple simultaneous update loops).
 
         Note:
-            The timer updates every 1 second using Tkinter's after()
+            The timer updates once per second using Tkinter's after()
             method, which schedules the _update_timer method to run
-            after UPDATE_INTERVAL milliseconds.
+            at the next whole second of elapsed time.
         """
         if self.is_running:
             # Already running, don't start another loop
             return
 
         self.is_running = True
+        # Count on from the current value
+        self._start_time = time.monotonic() - self.elapsed_seconds
         self._schedule_next_update()
 
     def stop(self) -> None:
@@ -128,11 +180,12 @@ class GameTimer:
         Stop the timer.
 
         Stops counting up at the current elapsed_seconds value.
-        Cancels any pending update callbacks scheduled by Tkinter.
 
         Note:
-            This method cancels the scheduled after() callback to
-            prevent the timer from continuing to count up.
+            The scheduled after() callback is not cancelled through Tcl.
+            Instead the timer's generation is bumped, so the pending
+            callback sees it is stale and returns without doing anything
+            when it fires, even if the timer has been started again since.
         """
         if not self.is_running:
             # Already stopped
@@ -140,10 +193,9 @@ class GameTimer:
 
         self.is_running = False
 
-        # Cancel the scheduled update if it exists
-        if self.timer_id is not None:
-            self.parent.after_cancel(self.timer_id)
-            self.timer_id = None
+        # Invalidate the scheduled update
+        self._generation += 1
+        self.timer_id = None
 
     def reset(self) -> None:
         """
@@ -170,32 +222,44 @@ class GameTimer:
         """
         Schedule the next timer update.
 
-        Schedules the _update_timer method to run after UPDATE_INTERVAL
-        milliseconds (1 second). This creates the recurring 1-second
-        update loop for the timer.
+        Schedules the _update_timer method to run when the elapsed time
+        next reaches a whole second, i.e. at most UPDATE_INTERVAL
+        milliseconds from now. Aligning to the start time, rather than
+        waiting a fixed interval after each update, keeps a late callback
+        from pushing every later update back.
         """
         if self.is_running:
-            self.timer_id = self.parent.after(self.UPDATE_INTERVAL, self._update_timer)
+            elapsed_ms = (time.monotonic() - self._start_time) * 1000
+            delay = self.UPDATE_INTERVAL - int(elapsed_ms) % self.UPDATE_INTERVAL
+            self.timer_id = self._after(
+                max(1, delay), partial(self._update_timer, self._generation)
+            )
 
-    def _update_timer(self) -> None:
+    def _update_timer(self, generation: int) -> None:
         """
         Update the timer display and schedule the next update.
 
-        Increments the elapsed_seconds counter, updates the display,
-        and schedules the next update if the timer is still running.
+        Sets elapsed_seconds from the monotonic clock, updates the display
+        if the shown second changed, and schedules the next update if the
+        timer is still running.
 
-        This method is called automatically every 1 second by the
+        This method is called automatically about once per second by the
         Tkinter after() mechanism.
+
+        Args:
+            generation: The timer generation the update was scheduled in.
         """
-        if not self.is_running:
-            # Timer was stopped, don't continue
+        if generation != self._generation or not self.is_running:
+            # Timer was stopped since this update was scheduled, don't continue
             return
 
-        # Increment elapsed time
-        self.elapsed_seconds += 1
+        # Read the true elapsed time (whole seconds, up to the display limit)
+        elapsed = min(int(time.monotonic() - self._start_time), self.MAX_DISPLAY)
 
-        # Update the display
-        self._update_display()
+        # Update the display only when the shown value changes
+        if elapsed != self.elapsed_seconds:
+            self.elapsed_seconds = elapsed
+            self._update_display()
 
         # Schedule next update if we haven't reached max
         if self.elapsed_seconds < self.MAX_DISPLAY:
@@ -208,10 +272,17 @@ class GameTimer:
         """
         Update the timer display.
 
-        Refreshes the label text with the current elapsed time.
-        The time is formatted as a 3-digit zero-padded number.
+        Refreshes the label text with the current elapsed time through its
+        text variable. The time is formatted as a 3-digit zero-padded number.
+        Nothing is sent to Tk when the text is unchanged (e.g. resetting a
+        timer that never started), and before the label exists the
+        text is only remembered for when it is created.
         """
-        self.label.config(text=self._format_display(self.elapsed_seconds))
+        text = self._format_display(self.elapsed_seconds)
+        if text != self._last_text:
+            self._last_text = text
+            if self._text_var is not None:
+                self._text_var.set(text)
 
     def get_elapsed_time(self) -> int:
         """
@@ -229,22 +300,24 @@ class GameTimer:
         """
         Pack the timer label into the parent widget.
 
-        This is a convenience method that delegates to the label's pack method,
+        This is a convenience method that creates the label on first use and
+        delegates to its pack method,
         allowing the timer to be easily positioned in the main window.
 
         Args:
             **kwargs: Keyword arguments to pass to label.pack().
         """
-        self.label.pack(**kwargs)
+        self._ensure_widget().pack(**kwargs)
 
     def grid(self, **kwargs) -> None:
         """
         Grid the timer label into the parent widget.
 
-        This is a convenience method that delegates to the label's grid method,
+        This is a convenience method that creates the label on first use and
+        delegates to its grid method,
         allowing the timer to be easily positioned in the main window.
 
         Args:
             **kwargs: Keyword arguments to pass to label.grid().
         """
-        self.label.grid(**kwargs)
+        self._ensure_widget().grid(**kwargs)
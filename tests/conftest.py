@@ -2,10 +2,79 @@
 
 import os
 
+import numpy as np
 import pytest
 
+from src.game.board import Board
+
 # Skip tests that require a display (like MainWindow tests) when running in headless CI
 skipif_no_display = pytest.mark.skipif(
     not os.environ.get("DISPLAY") and os.name != "nt",
     reason="Test requires a display (skipped in headless CI)",
 )
+
+
+@pytest.fixture(scope="session")
+def _tk_root():
+    """One hidden Tk root (and Tcl interpreter) shared by the whole session."""
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def tk_parent(_tk_root):
+    """A hidden Toplevel on the shared root, destroyed after each test."""
+    import tkinter as tk
+
+    top = tk.Toplevel(_tk_root)
+    top.withdraw()
+    yield top
+    top.destroy()
+
+
+RNG_SEED = 0xC0FFEE
+"""Seed for every generator the fixtures draw mine layouts from."""
+
+
+@pytest.fixture
+def seeded_rng():
+    """A fixed-seed NumPy Generator, so mine layouts are the same every run."""
+    return np.random.default_rng(RNG_SEED)
+
+
+@pytest.fixture(scope="session")
+def _mine_layouts():
+    """Mine masks drawn so far, keyed by (rows, cols, mines, first_click)."""
+    return {}
+
+
+@pytest.fixture
+def board_factory(_mine_layouts):
+    """
+    Build Boards, optionally with mines already placed from a seeded generator.
+
+    Call as board_factory(rows, cols, mines) for an empty board, or pass
+    first_click=(row, col) to also place the mines reproducibly. Each layout
+    is drawn once per session; later requests for the same one get a fresh
+    Board with the cached mask laid out, skipping the random draw.
+    """
+
+    def make(rows, cols, mines, first_click=None):
+        board = Board(rows, cols, mines)
+        if first_click is None:
+            return board
+
+        key = (rows, cols, mines, tuple(first_click))
+        mask = _mine_layouts.get(key)
+        if mask is None:
+            board.place_mines(*first_click, rng=np.random.default_rng(RNG_SEED))
+            _mine_layouts[key] = board.mine.copy()
+        else:
+            board.set_mines_from_mask(mask)
+        return board
+
+    return make
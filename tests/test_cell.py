@@ -6,126 +6,74 @@ cell state including mine placement, reveal status, flag status, and
 adjacent mine count.
 """
 
+from dataclasses import astuple
+
 import pytest
 
-from src.models.cell import Cell
+from src.game.board import Board
+from src.models.cell import Cell, CellView
 
 
 class TestCellInitialization:
     """Test suite for Cell initialization and default values."""
 
-    def test_default_values(self):
-        """Test that Cell initializes with correct default values."""
-        cell = Cell()
-
-        assert cell.mine is False, "Default mine should be False"
-        assert cell.revealed is False, "Default revealed should be False"
-        assert cell.flagged is False, "Default flagged should be False"
-        assert cell.adjacent_mines == 0, "Default adjacent_mines should be 0"
-
-    def test_custom_initialization_all_parameters(self):
-        """Test Cell initialization with all custom parameters."""
-        cell = Cell(mine=True, revealed=True, flagged=True, adjacent_mines=5)
-
-        assert cell.mine is True, "Custom mine should be True"
-        assert cell.revealed is True, "Custom revealed should be True"
-        assert cell.flagged is True, "Custom flagged should be True"
-        assert cell.adjacent_mines == 5, "Custom adjacent_mines should be 5"
-
-    def test_partial_initialization_mine_only(self):
-        """Test Cell initialization with only mine parameter."""
-        cell = Cell(mine=True)
-
-        assert cell.mine is True, "Custom mine should be True"
-        assert cell.revealed is False, "Default revealed should be False"
-        assert cell.flagged is False, "Default flagged should be False"
-        assert cell.adjacent_mines == 0, "Default adjacent_mines should be 0"
-
-    def test_partial_initialization_revealed_only(self):
-        """Test Cell initialization with only revealed parameter."""
-        cell = Cell(revealed=True)
-
-        assert cell.mine is False, "Default mine should be False"
-        assert cell.revealed is True, "Custom revealed should be True"
-        assert cell.flagged is False, "Default flagged should be False"
-        assert cell.adjacent_mines == 0, "Default adjacent_mines should be 0"
-
-    def test_partial_initialization_flagged_only(self):
-        """Test Cell initialization with only flagged parameter."""
-        cell = Cell(flagged=True)
-
-        assert cell.mine is False, "Default mine should be False"
-        assert cell.revealed is False, "Default revealed should be False"
-        assert cell.flagged is True, "Custom flagged should be True"
-        assert cell.adjacent_mines == 0, "Default adjacent_mines should be 0"
-
-    def test_partial_initialization_adjacent_mines_only(self):
-        """Test Cell initialization with only adjacent_mines parameter."""
-        cell = Cell(adjacent_mines=3)
-
-        assert cell.mine is False, "Default mine should be False"
-        assert cell.revealed is False, "Default revealed should be False"
-        assert cell.flagged is False, "Default flagged should be False"
-        assert cell.adjacent_mines == 3, "Custom adjacent_mines should be 3"
-
-    def test_multiple_custom_parameters(self):
-        """Test Cell initialization with multiple custom parameters."""
-        cell = Cell(mine=True, adjacent_mines=2)
-
-        assert cell.mine is True, "Custom mine should be True"
-        assert cell.revealed is False, "Default revealed should be False"
-        assert cell.flagged is False, "Default flagged should be False"
-        assert cell.adjacent_mines == 2, "Custom adjacent_mines should be 2"
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param({}, (False, False, False, 0), id="defaults"),
+            pytest.param(
+                {"mine": True, "revealed": True, "flagged": True, "adjacent_mines": 5},
+                (True, True, True, 5),
+                id="all_parameters",
+            ),
+            pytest.param({"mine": True}, (True, False, False, 0), id="mine_only"),
+            pytest.param(
+                {"revealed": True}, (False, True, False, 0), id="revealed_only"
+            ),
+            pytest.param({"flagged": True}, (False, False, True, 0), id="flagged_only"),
+            pytest.param(
+                {"adjacent_mines": 3}, (False, False, False, 3), id="adjacent_only"
+            ),
+            pytest.param(
+                {"mine": True, "adjacent_mines": 2},
+                (True, False, False, 2),
+                id="mine_and_adjacent",
+            ),
+        ],
+    )
+    def test_initialization(self, kwargs, expected):
+        """Test Cell initialization with custom and default parameters."""
+        cell = Cell(**kwargs)
+
+        assert cell == Cell(*expected), f"Cell({kwargs}) should equal Cell{expected}"
+        for name in ("mine", "revealed", "flagged"):
+            assert type(getattr(cell, name)) is bool, f"{name} should be a bool"
 
 
 class TestCellAttributes:
     """Test suite for Cell attribute assignment and mutation."""
 
-    def test_mine_attribute_mutation(self):
-        """Test that mine attribute can be mutated."""
-        cell = Cell()
-        assert cell.mine is False, "Initial mine should be False"
-
-        cell.mine = True
-        assert cell.mine is True, "Mine should be True after mutation"
-
-        cell.mine = False
-        assert cell.mine is False, "Mine should be False after second mutation"
-
-    def test_revealed_attribute_mutation(self):
-        """Test that revealed attribute can be mutated."""
+    @pytest.mark.parametrize(
+        "name, initial, value",
+        [
+            pytest.param("mine", False, True, id="mine"),
+            pytest.param("revealed", False, True, id="revealed"),
+            pytest.param("flagged", False, True, id="flagged"),
+            pytest.param("adjacent_mines", 0, 5, id="adjacent_mines"),
+        ],
+    )
+    def test_attribute_mutation(self, name, initial, value):
+        """Test that each attribute can be mutated and set back."""
         cell = Cell()
-        assert cell.revealed is False, "Initial revealed should be False"
+        assert getattr(cell, name) is initial, f"Initial {name} should be {initial}"
 
-        cell.revealed = True
-        assert cell.revealed is True, "Revealed should be True after mutation"
+        setattr(cell, name, value)
+        assert getattr(cell, name) == value, f"{name} should be {value} after mutation"
 
-        cell.revealed = False
-        assert cell.revealed is False, "Revealed should be False after second mutation"
-
-    def test_flagged_attribute_mutation(self):
-        """Test that flagged attribute can be mutated."""
-        cell = Cell()
-        assert cell.flagged is False, "Initial flagged should be False"
-
-        cell.flagged = True
-        assert cell.flagged is True, "Flagged should be True after mutation"
-
-        cell.flagged = False
-        assert cell.flagged is False, "Flagged should be False after second mutation"
-
-    def test_adjacent_mines_attribute_mutation(self):
-        """Test that adjacent_mines attribute can be mutated."""
-        cell = Cell()
-        assert cell.adjacent_mines == 0, "Initial adjacent_mines should be 0"
-
-        cell.adjacent_mines = 5
-        assert cell.adjacent_mines == 5, "Adjacent mines should be 5 after mutation"
-
-        cell.adjacent_mines = 0
+        setattr(cell, name, initial)
         assert (
-            cell.adjacent_mines == 0
-        ), "Adjacent mines should be 0 after second mutation"
+            getattr(cell, name) == initial
+        ), f"{name} should be {initial} after second mutation"
 
     def test_all_attributes_independent(self):
         """Test that all attributes are independent and don't affect each other."""
@@ -138,56 +86,30 @@ class TestCellAttributes:
         cell.adjacent_mines = 8
 
         # Verify all are set correctly
-        assert cell.mine is True, "Mine should be True"
-        assert cell.revealed is True, "Revealed should be True"
-        assert cell.flagged is True, "Flagged should be True"
-        assert cell.adjacent_mines == 8, "Adjacent mines should be 8"
+        assert astuple(cell) == (True, True, True, 8), "All attributes should be set"
 
         # Change one and verify others are unaffected
         cell.mine = False
+        assert astuple(cell) == (False, True, True, 8), "Only mine should change"
         assert cell.mine is False, "Mine should be False"
-        assert cell.revealed is True, "Revealed should still be True"
-        assert cell.flagged is True, "Flagged should still be True"
-        assert cell.adjacent_mines == 8, "Adjacent mines should still be 8"
-
 
-class TestAdjacentMinesRange:
-    """Test suite for adjacent_mines valid range (0-8)."""
+    def test_unknown_attributes_are_rejected(self):
+        """Test that the slotted Cell has no instance dict for stray attributes."""
+        cell = Cell()
 
-    def test_adjacent_mines_zero(self):
-        """Test that adjacent_mines can be 0 (no adjacent mines)."""
-        cell = Cell(adjacent_mines=0)
-        assert cell.adjacent_mines == 0, "Adjacent mines can be 0"
+        assert not hasattr(cell, "__dict__"), "Cell should be slotted"
+        with pytest.raises(AttributeError):
+            cell.mines = True  # Typo of "mine"
 
-    def test_adjacent_mines_one(self):
-        """Test that adjacent_mines can be 1."""
-        cell = Cell(adjacent_mines=1)
-        assert cell.adjacent_mines == 1, "Adjacent mines can be 1"
 
-    def test_adjacent_mines_eight(self):
-        """Test that adjacent_mines can be 8 (maximum)."""
-        cell = Cell(adjacent_mines=8)
-        assert cell.adjacent_mines == 8, "Adjacent mines can be 8"
+class TestAdjacentMinesRange:
+    """Test suite for adjacent_mines valid range (0-8)."""
 
-    def test_adjacent_mines_all_valid_values(self):
+    @pytest.mark.parametrize("count", range(9), ids=lambda count: f"adj={count}")
+    def test_adjacent_mines_valid_range(self, count):
         """Test that adjacent_mines can be any value from 0 to 8."""
-        for i in range(9):  # 0 through 8
-            cell = Cell(adjacent_mines=i)
-            assert cell.adjacent_mines == i, f"Adjacent mines should be {i}"
-
-    def test_adjacent_mines_boundary_values(self):
-        """Test adjacent_mines at boundary values."""
-        # Test lower boundary
-        cell_min = Cell(adjacent_mines=0)
-        assert cell_min.adjacent_mines == 0, "Lower boundary should be 0"
-
-        # Test upper boundary
-        cell_max = Cell(adjacent_mines=8)
-        assert cell_max.adjacent_mines == 8, "Upper boundary should be 8"
-
-        # Test midpoint
-        cell_mid = Cell(adjacent_mines=4)
-        assert cell_mid.adjacent_mines == 4, "Midpoint should be 4"
+        cell = Cell(adjacent_mines=count)
+        assert cell.adjacent_mines == count, f"Adjacent mines should be {count}"
 
 
 class TestCellStates:
@@ -323,6 +245,58 @@ class TestCellDataclassBehavior:
         assert cell2.revealed is False, "cell2 revealed should still be False"
 
 
+class TestCellView:
+    """Test suite for CellView proxies over a Board's cell arrays."""
+
+    def test_view_reads_board_arrays(self):
+        """Test that a CellView reflects the values stored in the board arrays."""
+        board = Board(3, 3, 0)
+        board.mine[1, 2] = True
+        board.adjacent_mines[1, 2] = 4
+
+        cell = board.get_cell(1, 2)
+
+        assert isinstance(cell, CellView)
+        assert cell.mine is True, "View should expose mine as a plain bool"
+        assert cell.revealed is False, "View should expose revealed as a plain bool"
+        assert cell.adjacent_mines == 4, "View should expose adjacent_mines"
+        assert type(cell.adjacent_mines) is int, "adjacent_mines should be an int"
+
+    def test_view_writes_through_to_board_arrays(self):
+        """Test that assigning through a CellView updates the board arrays."""
+        board = Board(3, 3, 0)
+        cell = board.grid[2][0]
+
+        cell.revealed = True
+        cell.flagged = True
+
+        assert board.revealed[2, 0], "Write should land in the revealed array"
+        assert board.flagged[2, 0], "Write should land in the flagged array"
+        assert board.revealed.sum() == 1, "Only the viewed cell should change"
+
+    def test_view_equals_matching_cell(self):
+        """Test that a CellView compares equal to a Cell with the same values."""
+        board = Board(3, 3, 0)
+        board.mine[0, 0] = True
+
+        assert board.get_cell(0, 0) == Cell(mine=True)
+        assert board.get_cell(0, 1) != Cell(mine=True)
+
+    def test_view_writes_keep_zero_adj_mask_in_step(self):
+        """Test that mine and count writes update the board's zero_adj mask."""
+        board = Board(3, 3, 0)
+        cell = board.grid[1][1]
+
+        cell.adjacent_mines = 2
+        assert not board.zero_adj[1, 1], "Numbered cells should not spread fill"
+
+        cell.adjacent_mines = 0
+        assert board.zero_adj[1, 1], "Blank safe cells should spread fill"
+
+        cell.mine = True
+        assert not board.zero_adj[1, 1], "Mines should never spread fill"
+
+
 if __name__ == "__main__":
     # Run tests when executed directly
     pytest.main([__file__, "-v"])
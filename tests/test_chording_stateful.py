@@ -0,0 +1,99 @@
+"""
+Stateful Test Suite for Chording
+
+Drives a board through random sequences of reveals, flag toggles and chords
+with a Hypothesis state machine, checking after every step the invariants the
+scripted chording tests check for single scenarios: mines, adjacent counts
+and flags are never changed by chording, and no cell is both revealed and
+flagged. Skipped when Hypothesis is not installed.
+"""
+
+import numpy as np
+import pytest
+
+try:
+    from hypothesis import settings, stateful
+    from hypothesis import strategies as st
+except ImportError:
+    pytest.skip("Hypothesis is not installed", allow_module_level=True)
+
+from src.game.board import Board
+
+ROWS, COLS, MINES = 5, 5, 3
+"""Board shape used by the state machine, matching the scripted tests."""
+
+rows = st.integers(0, ROWS - 1)
+cols = st.integers(0, COLS - 1)
+
+
+class ChordMachine(stateful.RuleBasedStateMachine):
+    """Random play on one board, checking the chording invariants each step."""
+
+    @stateful.initialize(seed=st.integers(0, 2**32 - 1), row=rows, col=cols)
+    def place_mines(self, seed, row, col):
+        """Lay out the mines from a drawn seed and first-click cell."""
+        self.board = Board(ROWS, COLS, MINES)
+        self.board.place_mines(row, col, rng=np.random.default_rng(seed))
+        self.mines = self.board.mine.copy()
+        self.adjacent = self.board.adjacent_mines.copy()
+
+    @stateful.rule(row=rows, col=cols)
+    def reveal(self, row, col):
+        """Left-click a cell; flagged cells are left alone, as in the UI."""
+        if self.board.is_lost():
+            return
+        if not self.board.flagged[row, col]:
+            self.board.reveal_cell(row, col)
+
+    @stateful.rule(row=rows, col=cols)
+    def toggle_flag(self, row, col):
+        """Right-click a hidden cell to flag or unflag it."""
+        if self.board.is_lost():
+            return
+        cell = self.board.grid[row][col]
+        if not cell.revealed:
+            cell.flagged = not cell.flagged
+
+    @stateful.rule(row=rows, col=cols)
+    def chord(self, row, col):
+        """Chord a cell and check that the flags were left as they were."""
+        if self.board.is_lost():
+            return
+        flagged_before = self.board.flagged.copy()
+
+        self.board.chord_cell(row, col)
+
+        assert np.array_equal(
+            self.board.flagged, flagged_before
+        ), "Chording should not add or remove flags"
+
+    @stateful.invariant()
+    def mines_unchanged(self):
+        """Mine placement never changes after the first click."""
+        assert np.array_equal(self.board.mine, self.mines)
+
+    @stateful.invariant()
+    def adjacent_counts_unchanged(self):
+        """Adjacent mine counts never change after the first click."""
+        assert np.array_equal(self.board.adjacent_mines, self.adjacent)
+
+    @stateful.invariant()
+    def flagged_cells_stay_hidden(self):
+        """No cell is ever both revealed and flagged."""
+        assert not (self.board.revealed & self.board.flagged).any()
+
+    @stateful.invariant()
+    def revealed_count_matches(self):
+        """The running revealed count agrees with the revealed array."""
+        assert self.board.revealed_count == self.board.revealed.sum()
+
+    @stateful.invariant()
+    def flag_count_matches(self):
+        """The running flag count agrees with the flagged array."""
+        assert self.board.flag_count == self.board.flagged.sum()
+
+
+ChordMachine.TestCase.settings = settings(
+    max_examples=50, stateful_step_count=20, deadline=None
+)
+TestChordMachine = ChordMachine.TestCase
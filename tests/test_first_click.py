@@ -5,6 +5,7 @@ Verifies that the mine placement algorithm guarantees the first-click cell
 and all 8 of its neighbors are mine-free across multiple random generations.
 """
 
+import numpy as np
 import pytest
 
 from src.game.board import Board
@@ -224,6 +225,26 @@ class TestFirstClickSafety:
                 ].mine, f"Position ({first_row}, {first_col}):"
                 " First-click should never be a mine"
 
+    def test_densest_board_fills_every_eligible_cell(self):
+        """Test that a board with every unprotected cell mined can be placed."""
+        board = Board(9, 9, 81 - 9)
+
+        board.place_mines(4, 4)
+
+        assert board.mine.sum() == 72, "Every unprotected cell should be a mine"
+        assert not board.mine[3:6, 3:6].any(), "Protected zone should stay clear"
+
+    def test_seeded_generator_gives_reproducible_layout(self):
+        """Test that the same seeded generator places the same mines."""
+        first = Board(16, 30, 99)
+        second = Board(16, 30, 99)
+
+        first.place_mines(8, 15, rng=np.random.default_rng(1234))
+        second.place_mines(8, 15, rng=np.random.default_rng(1234))
+
+        assert np.array_equal(first.mine, second.mine)
+        assert first.mine.sum() == 99
+
 
 if __name__ == "__main__":
     # Run tests when executed directly
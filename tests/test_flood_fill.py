@@ -5,8 +5,11 @@ Verifies that the flood fill algorithm correctly reveals connected blank regions
 when cells with 0 adjacent mines are clicked, and stops at numbered cells.
 """
 
+import numpy as np
 import pytest
 
+from src.game import flood_fill_nb
+from src.game.adjacent_counter import calculate_adjacent_mines_np
 from src.game.board import Board
 
 
@@ -308,6 +311,54 @@ class TestFloodFill:
                     == adjacent_counts_before[row][col]
                 ), f"Flood fill should not change adjacent count at ({row}, {col})"
 
+    def test_flood_fill_marks_revealed_cells_dirty(self):
+        """Test that a fill reports exactly the cells it revealed, once."""
+        board = Board(5, 5, 0)
+        board.grid[0][0].flagged = True
+        assert board.take_dirty_cells() == [(0, 0)], "Flagging marks the cell"
+
+        board.reveal_cell(2, 2)
+
+        dirty = sorted(board.take_dirty_cells())
+        expected = [
+            (row, col) for row in range(5) for col in range(5) if (row, col) != (0, 0)
+        ]
+        assert dirty == expected, "Every revealed cell should be dirty"
+        assert board.take_dirty_cells() == [], "Dirty cells are cleared once taken"
+
+    def test_warm_up_builds_only_requested_shape(self):
+        """Test that warm_up builds the kernel for its shape and no other."""
+        flood_fill_nb._specialized_kernels.clear()
+
+        flood_fill_nb.warm_up(9, 9)
+
+        assert set(flood_fill_nb._specialized_kernels) == {(9, 9)}
+
+    @pytest.mark.parametrize("rows,cols", flood_fill_nb.SPECIALIZED_SHAPES)
+    def test_specialized_kernel_matches_generic(self, rows, cols):
+        """Test that shape-specialized kernels reveal what the generic one does."""
+        rng = np.random.default_rng(rows * cols)
+        mine = rng.random((rows, cols)) < 0.15
+        zero_adj = (calculate_adjacent_mines_np(mine) == 0) & ~mine
+        flagged = np.zeros((rows, cols), dtype=np.bool_)
+        seeds = np.flatnonzero(~mine)[:3].astype(np.int64)
+
+        kernel = flood_fill_nb.kernel_for_shape(rows, cols)
+        assert kernel is not flood_fill_nb.flood_fill_into_nb
+        assert kernel is flood_fill_nb.kernel_for_shape(rows, cols), "Built once"
+
+        specialized = np.zeros((rows, cols), dtype=np.bool_)
+        generic = np.zeros((rows, cols), dtype=np.bool_)
+        queue = np.empty(rows * cols, dtype=np.int32)
+        count = kernel(specialized, flagged, zero_adj, seeds, queue)
+
+        generic_queue = np.empty(rows * cols, dtype=np.int32)
+        assert count == flood_fill_nb.flood_fill_into_nb(
+            generic, flagged, zero_adj, seeds, generic_queue
+        )
+        assert np.array_equal(specialized, generic)
+        assert sorted(queue[:count]) == np.flatnonzero(specialized).tolist()
+
 
 if __name__ == "__main__":
     # Run tests when executed directly
@@ -0,0 +1,53 @@
+"""
+Test Suite for the Reset Button Face States
+
+Verifies the face state machine of ResetButton. The button widget is only
+created when the button is placed, so these tests need no display.
+"""
+
+import pytest
+
+from src.ui.reset_button import ResetButton
+
+
+class TestResetButtonState:
+    """Test suite for ResetButton face states before the widget exists."""
+
+    def setup_method(self):
+        # Never placed, so the parent is not used by Tk
+        self.button = ResetButton(parent=object())
+
+    def test_starts_happy_without_creating_widget(self):
+        """Test that a new button shows the happy face and has no widget yet."""
+        assert self.button.get_state() == "happy"
+        assert self.button._button is None, "Widget should be created lazily"
+
+    def test_setters_change_state(self):
+        """Test that each face setter records its state."""
+        self.button.set_shocked()
+        assert self.button.get_state() == "shocked"
+        self.button.set_dead()
+        assert self.button.get_state() == "dead"
+        self.button.set_cool()
+        assert self.button.get_state() == "cool"
+        self.button.set_happy()
+        assert self.button.get_state() == "happy"
+
+    def test_set_state_by_name(self):
+        """Test that set_state dispatches valid names and rejects unknown ones."""
+        self.button.set_state("dead")
+        assert self.button.get_state() == "dead"
+
+        with pytest.raises(ValueError):
+            self.button.set_state("sleepy")
+        assert self.button.get_state() == "dead", "Invalid state should not apply"
+
+    def test_faces_are_distinct(self):
+        """Test that every face state has its own icon."""
+        assert set(ResetButton.FACES) == ResetButton.VALID_STATES
+        assert len(set(ResetButton.FACES.values())) == len(ResetButton.VALID_STATES)
+
+
+if __name__ == "__main__":
+    # Run tests when executed directly
+    pytest.main([__file__, "-v"])
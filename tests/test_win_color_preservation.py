@@ -7,7 +7,6 @@ from happy to cool, and cells are disabled, but no color changes occur.
 """
 
 import os
-import tkinter as tk
 
 import pytest
 
@@ -480,16 +479,14 @@ class TestUpdateCellColorConsistency:
         not os.environ.get("DISPLAY") and os.name != "nt",
         reason="Test requires a display (skipped in headless CI)",
     )
-    def test_update_cell_with_revealed_state(self):
+    def test_update_cell_with_revealed_state(self, tk_parent):
         """Test that update_cell maintains consistent color for revealed cells."""
-        # Create a test grid
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
+        # Create a test grid on the session's shared Tk root
 
         board = Board(5, 5, 3)
         board.place_mines(2, 2)
 
-        grid = GameGrid(root, board, cell_size=30)
+        grid = GameGrid(tk_parent, board, cell_size=30)
         grid.pack()
 
         # Reveal all non-mine cells
@@ -509,12 +506,12 @@ class TestUpdateCellColorConsistency:
             for col in range(5):
                 cell = board.grid[row][col]
                 if cell.revealed and not cell.mine:
-                    button = grid.buttons[row][col]
+                    appearance = grid.cell_appearance(row, col)
 
                     # The key assertion: colors should match the win condition
                     # Revealed cells should be sunken with #c0c0c0 background
-                    bg_colors.add(button.cget("bg"))
-                    reliefs.add(button.cget("relief"))
+                    bg_colors.add(appearance["bg"])
+                    reliefs.add(appearance["relief"])
 
         # All revealed cells should have consistent appearance
         assert (
@@ -528,22 +525,18 @@ class TestUpdateCellColorConsistency:
         assert "#c0c0c0" in bg_colors, f"Background should be #c0c0c0, got {bg_colors}"
         assert "sunken" in reliefs, f"Relief should be sunken, got {reliefs}"
 
-        root.destroy()
-
     @pytest.mark.skipif(
         not os.environ.get("DISPLAY") and os.name != "nt",
         reason="Test requires a display (skipped in headless CI)",
     )
-    def test_update_cell_with_unrevealed_state(self):
+    def test_update_cell_with_unrevealed_state(self, tk_parent):
         """Test that update_cell maintains consistent color for unrevealed cells."""
-        # Create a test grid
-        root = tk.Tk()
-        root.withdraw()
+        # Create a test grid on the session's shared Tk root
 
         board = Board(5, 5, 3)
         board.place_mines(2, 2)
 
-        grid = GameGrid(root, board, cell_size=30)
+        grid = GameGrid(tk_parent, board, cell_size=30)
         grid.pack()
 
         # Reveal all non-mine cells to trigger win
@@ -563,11 +556,11 @@ class TestUpdateCellColorConsistency:
             for col in range(5):
                 cell = board.grid[row][col]
                 if not cell.revealed and not cell.mine:
-                    button = grid.buttons[row][col]
+                    appearance = grid.cell_appearance(row, col)
 
                     # Unrevealed cells should be raised with lightgray background
-                    bg_colors.add(button.cget("bg"))
-                    reliefs.add(button.cget("relief"))
+                    bg_colors.add(appearance["bg"])
+                    reliefs.add(appearance["relief"])
 
         # All unrevealed cells should have consistent appearance
         assert (
@@ -583,22 +576,18 @@ class TestUpdateCellColorConsistency:
         ), f"Background should be lightgray, got {bg_colors}"
         assert "raised" in reliefs, f"Relief should be raised, got {reliefs}"
 
-        root.destroy()
-
     @pytest.mark.skipif(
         not os.environ.get("DISPLAY") and os.name != "nt",
         reason="Test requires a display (skipped in headless CI)",
     )
-    def test_update_cell_preserves_number_colors(self):
+    def test_update_cell_preserves_number_colors(self, tk_parent):
         """Test that update_cell preserves number colors during win."""
-        # Create a test grid
-        root = tk.Tk()
-        root.withdraw()
+        # Create a test grid on the session's shared Tk root
 
         board = Board(5, 5, 3)
         board.place_mines(2, 2)
 
-        grid = GameGrid(root, board, cell_size=30)
+        grid = GameGrid(tk_parent, board, cell_size=30)
         grid.pack()
 
         # Reveal cells with different numbers
@@ -613,10 +602,10 @@ class TestUpdateCellColorConsistency:
 
         # Check number colors
         number_colors = {
-            1: grid.buttons[1][1].cget("fg"),
-            2: grid.buttons[1][2].cget("fg"),
-            3: grid.buttons[1][3].cget("fg"),
-            4: grid.buttons[1][4].cget("fg"),
+            1: grid.cell_appearance(1, 1)["fg"],
+            2: grid.cell_appearance(1, 2)["fg"],
+            3: grid.cell_appearance(1, 3)["fg"],
+            4: grid.cell_appearance(1, 4)["fg"],
         }
 
         # Numbers should have their correct colors
@@ -625,8 +614,6 @@ class TestUpdateCellColorConsistency:
         assert number_colors[3] == "red"
         assert number_colors[4] == "dark blue"
 
-        root.destroy()
-
 
 class TestWinIntegrationColorTests:
     """Integration tests for win condition with color preservation."""
@@ -684,9 +671,9 @@ class TestWinIntegrationColorTests:
             for col in range(9):
                 cell = window.board.get_cell(row, col)
                 if not cell.mine:
-                    button = window.game_grid.buttons[row][col]
-                    bg_colors.add(button.cget("bg"))
-                    reliefs.add(button.cget("relief"))
+                    appearance = window.game_grid.cell_appearance(row, col)
+                    bg_colors.add(appearance["bg"])
+                    reliefs.add(appearance["relief"])
 
         # All cells should have consistent appearance
         assert len(bg_colors) == 1, f"All cells should have same bg, got {bg_colors}"
@@ -727,9 +714,9 @@ class TestWinIntegrationColorTests:
 
         for row in range(9):
             for col in range(9):
-                button = window.game_grid.buttons[row][col]
-                bg_colors.add(button.cget("bg"))
-                reliefs.add(button.cget("relief"))
+                appearance = window.game_grid.cell_appearance(row, col)
+                bg_colors.add(appearance["bg"])
+                reliefs.add(appearance["relief"])
 
         # Should have two states: raised/unrevealed and sunken/revealed
         assert len(bg_colors) >= 1, f"Should have consistent bg colors, got {bg_colors}"
@@ -5,6 +5,7 @@ Verifies that the game correctly detects when the player has won (all non-mine
 cells revealed) or lost (mine clicked and revealed).
 """
 
+import numpy as np
 import pytest
 
 from src.game.board import Board
@@ -254,6 +255,23 @@ class TestLossDetection:
         # Check that game is lost
         assert board.is_lost(), "Game should be lost when multiple mines are revealed"
 
+    def test_reveal_mines_reveals_every_mine_once(self):
+        """Test that revealing all mines counts and reports each mine once."""
+        board = Board(5, 5, 5)
+        board.place_mines(2, 2)
+        board.reveal_cell(2, 2)
+        board.take_dirty_cells()
+        revealed_before = board.revealed_count
+
+        board.reveal_mines()
+
+        assert board.revealed[board.mine].all(), "Every mine should be revealed"
+        assert board.revealed_count == revealed_before + 5
+        assert board.is_lost(), "Revealed mines count as a loss"
+        assert sorted(board.take_dirty_cells()) == sorted(
+            map(tuple, np.argwhere(board.mine).tolist())
+        ), "Only the mines should be redrawn"
+
     def test_flagged_mines_do_not_trigger_loss(self):
         """Test that flagging a mine does not trigger loss."""
         board = Board(5, 5, 5)
@@ -438,6 +456,27 @@ class TestEdgeCases:
         board.update_game_state()
         assert board.game_state == GameState.WON, "State should be WON after update"
 
+    def test_revealed_count_tracks_every_reveal_path(self):
+        """Test that the running revealed count matches the revealed array."""
+        board = Board(9, 9, 10)
+        board.place_mines(4, 4)
+
+        # Flood fill through the kernel
+        board.reveal_cell(4, 4)
+        assert board.revealed_count == board.revealed.sum()
+
+        # Direct writes through the cell views, including redundant ones
+        hidden = [
+            (r, c) for r in range(9) for c in range(9) if not board.revealed[r, c]
+        ]
+        row, col = hidden[0]
+        board.grid[row][col].revealed = True
+        board.grid[row][col].revealed = True
+        assert board.revealed_count == board.revealed.sum()
+
+        board.grid[row][col].revealed = False
+        assert board.revealed_count == board.revealed.sum()
+
 
 if __name__ == "__main__":
     # Run tests when executed directly